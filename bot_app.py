@@ -84,7 +84,11 @@ class BotApp:
 
     async def run(self) -> None:
         logging.info("Connecting to Postgres…")
-        await create_pool(self.config.database_url)
+        await create_pool(
+            self.config.database_url,
+            min_size=self.config.db_pool_min_size,
+            max_size=self.config.db_pool_max_size,
+        )
         logging.info(
             "Bot is starting… (request_chat_id=%s, city_cash_chats=%s, ignore_chat_ids=%s, "
             "city_cash_chat_ids=%s, rate_orders_chat_id=%s, aml_enabled=%s, rapira_enabled=%s)",
@@ -109,4 +113,11 @@ def run_app() -> None:
     )
     config = Config.from_env()
     app = BotApp(config)
-    asyncio.run(app.run())
+    # uvloop — необязательная зависимость: если установлен, цикл событий заметно быстрее
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(app.run())
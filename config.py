@@ -58,6 +58,9 @@ def _parse_city_chat_map(s: str | None, *, env_name: str) -> dict[str, int]:
 class Config:
     bot_token: str
     database_url: str
+    # размер пула asyncpg; None — значения по умолчанию из db_asyncpg.pool
+    db_pool_min_size: int | None
+    db_pool_max_size: int | None
     converter_api_base_url: str | None
     converter_api_token: str | None
     tronscan_api_base_url: str | None
@@ -105,6 +108,8 @@ class Config:
         db_url = os.getenv("DATABASE_URL", "").strip()
         if not db_url:
             raise RuntimeError("Не найден DATABASE_URL в окружении")
+        db_pool_min_size = _parse_int(os.getenv("DB_POOL_MIN_SIZE"))
+        db_pool_max_size = _parse_int(os.getenv("DB_POOL_MAX_SIZE"))
 
         converter_api_base_url = (os.getenv("CONVERTER_API_BASE_URL", "") or "").strip() or None
         converter_api_token = (os.getenv("CONVERTER_API_TOKEN", "") or "").strip() or None
@@ -165,6 +170,8 @@ class Config:
         return cls(
             bot_token=token,
             database_url=db_url,
+            db_pool_min_size=db_pool_min_size,
+            db_pool_max_size=db_pool_max_size,
             converter_api_base_url=converter_api_base_url,
             converter_api_token=converter_api_token,
             tronscan_api_base_url=tronscan_api_base_url,
@@ -0,0 +1,57 @@
+"""
+Горячие read-запросы, общие для репозиториев и прогрева пула.
+
+asyncpg кеширует подготовленные statement'ы per-connection по тексту SQL,
+поэтому репозитории и `warm_connection` обязаны использовать одни и те же строки.
+"""
+from __future__ import annotations
+
+import logging
+
+import asyncpg
+
+log = logging.getLogger(__name__)
+
+SQL_CLIENT_BY_CHAT = "SELECT id, name, client_group, is_active FROM clients WHERE chat_id=$1"
+
+SQL_SNAPSHOT_WALLET = """
+                SELECT id, UPPER(currency_code) AS currency_code, precision, balance
+                FROM client_accounts
+                WHERE client_id=$1 AND is_active=TRUE
+                ORDER BY currency_code
+                """
+
+SQL_GET_ACCOUNT = """
+                SELECT id, currency_code, precision, balance
+                FROM client_accounts
+                WHERE client_id=$1 AND currency_code=$2 AND is_active=TRUE
+                """
+
+SQL_IS_MANAGER = "SELECT 1 FROM managers WHERE user_id=$1"
+
+SQL_LIST_MANAGERS = "SELECT user_id, display_name, added_at FROM managers ORDER BY added_at"
+
+SQL_GET_SETTING = "SELECT value FROM app_settings WHERE key=$1"
+
+# (sql, аргументы-заглушки) — заглушки не совпадают ни с одной строкой
+_WARMUP: tuple[tuple[str, tuple], ...] = (
+    (SQL_CLIENT_BY_CHAT, (0,)),
+    (SQL_SNAPSHOT_WALLET, (0,)),
+    (SQL_GET_ACCOUNT, (0, "")),
+    (SQL_IS_MANAGER, (0,)),
+    (SQL_LIST_MANAGERS, ()),
+    (SQL_GET_SETTING, ("",)),
+)
+
+
+async def warm_connection(con: asyncpg.Connection) -> None:
+    """
+    init-хук пула: прогоняет горячие запросы на новом соединении, чтобы
+    parse/plan попал в statement-кеш asyncpg до первого реального хендлера.
+    """
+    for sql, args in _WARMUP:
+        try:
+            await con.fetch(sql, *args)
+        except asyncpg.PostgresError:
+            # прогрев — оптимизация: схема без таблицы не должна ронять создание пула
+            log.warning("Statement warm-up failed: %s", sql.split()[0:4], exc_info=True)
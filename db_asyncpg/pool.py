@@ -1,13 +1,47 @@
 
+import os
+
 import asyncpg
 
+from db_asyncpg.hot_queries import warm_connection
+
 _pool: asyncpg.Pool | None = None
 
+# Держим тёплыми хотя бы столько соединений, сколько ядер (но не меньше 4):
+# обработчики бота почти целиком I/O-bound, холодный коннект — лишний RTT+auth.
+_DEFAULT_MIN_SIZE = max(4, os.cpu_count() or 1)
+# Потолок ≈ числу одновременно обрабатываемых апдейтов; под нагрузку задаётся DB_POOL_MAX_SIZE.
+_DEFAULT_MAX_SIZE = 20
+
+_SERVER_SETTINGS = {
+    # короткие OLTP-запросы: JIT только добавляет задержку на планирование
+    "jit": "off",
+    "application_name": "skyex_bot",
+}
+
 
-async def create_pool(dsn: str, min_size: int = 1, max_size: int = 10) -> asyncpg.Pool:
+async def create_pool(
+        dsn: str,
+        min_size: int | None = None,
+        max_size: int | None = None,
+) -> asyncpg.Pool:
     global _pool
     if _pool is None:
-        _pool = await asyncpg.create_pool(dsn, min_size=min_size, max_size=max_size)
+        min_size = min_size or _DEFAULT_MIN_SIZE
+        max_size = max_size or _DEFAULT_MAX_SIZE
+        _pool = await asyncpg.create_pool(
+            dsn,
+            min_size=min(min_size, max_size),
+            max_size=max_size,
+            # соединение переоткрывается после N запросов — ограничивает рост памяти бэкенда
+            max_queries=50_000,
+            max_inactive_connection_lifetime=300.0,
+            # asyncpg сам готовит и кеширует statement'ы per-connection — даём кешу места
+            statement_cache_size=1024,
+            server_settings=_SERVER_SETTINGS,
+            # горячие запросы готовим при открытии соединения, а не на первом апдейте
+            init=warm_connection,
+        )
     return _pool
 
 
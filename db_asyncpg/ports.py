@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Protocol
@@ -24,10 +25,14 @@ class ClientRepositoryPort(Protocol):
 class WalletRepositoryPort(Protocol):
     async def add_currency(self, client_id: int, currency_code: str, precision: int) -> int: ...
 
+    async def ensure_accounts(self, client_id: int, currencies: Sequence[tuple[str, int]]) -> None: ...
+
     async def remove_currency(self, client_id: int, currency_code: str) -> bool: ...
 
     async def snapshot_wallet(self, client_id: int) -> list[dict[str, Any]]: ...
 
+    async def get_account(self, client_id: int, currency_code: str) -> dict[str, Any] | None: ...
+
     async def balances_by_client(self) -> list[dict[str, Any]]: ...
 
 
@@ -36,6 +41,10 @@ class TransactionRepositoryPort(Protocol):
 
     async def withdraw(self, **kwargs) -> int: ...
 
+    async def deposit_with_balance(self, **kwargs) -> dict[str, Any]: ...
+
+    async def withdraw_with_balance(self, **kwargs) -> dict[str, Any]: ...
+
     async def history(
             self,
             account_id: int,
@@ -1,11 +1,57 @@
 from __future__ import annotations
 
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import Any
 
+from db_asyncpg.hot_queries import SQL_CLIENT_BY_CHAT, SQL_GET_ACCOUNT, SQL_SNAPSHOT_WALLET
 from db_asyncpg.pool import get_pool
 from db_asyncpg.utils import to_upper
 
 
+class _ClientIdCache:
+    """
+    TTL-LRU chat_id -> client_id для ensure_client.
+    Попадание только если имя (и группа, если передана) совпадают с тем,
+    с чем клиент был закреплён в последний раз, — иначе идём в БД за апдейтом.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0) -> None:
+        self._m: OrderedDict[int, tuple[str, str | None, int, float]] = OrderedDict()
+        self._max = maxsize
+        self._ttl = ttl
+
+    def get(self, chat_id: int, name: str, client_group: str | None) -> int | None:
+        hit = self._m.get(chat_id)
+        if hit is None:
+            return None
+        c_name, c_group, client_id, expires = hit
+        if expires < time.monotonic():
+            del self._m[chat_id]
+            return None
+        if c_name != name or (client_group is not None and c_group != client_group):
+            return None
+        self._m.move_to_end(chat_id)
+        return client_id
+
+    def put(self, chat_id: int, name: str, client_group: str | None, client_id: int) -> None:
+        self._m[chat_id] = (name, client_group, client_id, time.monotonic() + self._ttl)
+        self._m.move_to_end(chat_id)
+        if len(self._m) > self._max:
+            self._m.popitem(last=False)
+
+    def invalidate(self, chat_id: int) -> None:
+        self._m.pop(chat_id, None)
+
+    def clear(self) -> None:
+        self._m.clear()
+
+
+_client_ids = _ClientIdCache()
+
+
 class ClientsRepo:
     async def update_client_chat_id(self, *, client_id: int, new_chat_id: int) -> None:
         pool = await get_pool()
@@ -22,6 +68,8 @@ class ClientsRepo:
                     "UPDATE clients SET chat_id=$1 WHERE id=$2",
                     int(new_chat_id), int(client_id),
                 )
+        # старый chat_id клиента тут неизвестен — операция редкая, сбрасываем всё
+        _client_ids.clear()
 
     async def find_client_by_name_exact(self, name: str) -> dict[str, Any] | None:
         pool = await get_pool()
@@ -40,13 +88,18 @@ class ClientsRepo:
             return dict(row) if row else None
 
     async def ensure_client(self, chat_id: int, name: str, client_group: str | None = None) -> int:
+        cached = _client_ids.get(int(chat_id), name, client_group)
+        if cached is not None:
+            return cached
+        client_id = await self._ensure_client_db(chat_id, name, client_group)
+        _client_ids.put(int(chat_id), name, client_group, client_id)
+        return client_id
+
+    async def _ensure_client_db(self, chat_id: int, name: str, client_group: str | None) -> int:
         pool = await get_pool()
         async with pool.acquire() as con:
             async with con.transaction():
-                row = await con.fetchrow(
-                    "SELECT id, name, client_group, is_active FROM clients WHERE chat_id=$1",
-                    int(chat_id),
-                )
+                row = await con.fetchrow(SQL_CLIENT_BY_CHAT, int(chat_id))
                 if row:
                     need_update_ng = (
                         (name and row["name"] != name)
@@ -89,6 +142,8 @@ class ClientsRepo:
                     (name or "").strip(),
                 )
                 if by_name:
+                    if by_name["chat_id"] is not None:
+                        _client_ids.invalidate(int(by_name["chat_id"]))
                     await con.execute(
                         """
                         UPDATE clients
@@ -124,7 +179,8 @@ class ClientsRepo:
                     """,
                     chat_id,
                 )
-                return res.endswith(" 1")
+        _client_ids.invalidate(int(chat_id))
+        return res.endswith(" 1")
 
     async def list_clients(self) -> list[dict]:
         pool = await get_pool()
@@ -143,7 +199,7 @@ class ClientsRepo:
                 LEFT JOIN client_accounts a ON a.client_id = c.id
                 WHERE c.is_active = TRUE
                 GROUP BY c.id
-                ORDER BY c.created_at DESC, c.id DESC
+                ORDER BY LOWER(c.name) COLLATE "C", c.id
                 """
             )
             return [dict(r) for r in rows]
@@ -166,7 +222,7 @@ class ClientsRepo:
                 WHERE c.is_active = TRUE
                   AND LOWER(COALESCE(c.client_group, '')) = LOWER($1)
                 GROUP BY c.id
-                ORDER BY c.created_at DESC, c.id DESC
+                ORDER BY LOWER(c.name) COLLATE "C", c.id
                 """,
                 client_group.strip(),
             )
@@ -189,6 +245,24 @@ class ClientsRepo:
                 )
                 return rec["id"]
 
+    async def ensure_accounts(self, client_id: int, currencies: Sequence[tuple[str, int]]) -> None:
+        """Заводит недостающие счета одним запросом; активные счета не трогает."""
+        codes = [to_upper(code) for code, _ in currencies]
+        precisions = [precision for _, precision in currencies]
+        pool = await get_pool()
+        async with pool.acquire() as con:
+            await con.execute(
+                """
+                INSERT INTO client_accounts(client_id, currency_code, precision)
+                SELECT $1, u.code, u.prec
+                FROM unnest($2::text[], $3::smallint[]) AS u(code, prec)
+                ON CONFLICT (client_id, currency_code)
+                DO UPDATE SET is_active = TRUE, precision = EXCLUDED.precision, deactivated_at = NULL
+                WHERE client_accounts.is_active = FALSE
+                """,
+                client_id, codes, precisions,
+            )
+
     async def remove_currency(self, client_id: int, currency_code: str) -> bool:
         code = to_upper(currency_code)
         pool = await get_pool()
@@ -208,18 +282,22 @@ class ClientsRepo:
                 return res.endswith(" 1")
 
     async def snapshot_wallet(self, client_id: int) -> list[dict[str, Any]]:
+        # currency_code нормализуем в UPPER здесь, чтобы потребители не делали это построчно,
+        # и интернируем: сравнение с кодами из CMD_MAP/парсеров сводится к проверке identity.
         pool = await get_pool()
         async with pool.acquire() as con:
-            rows = await con.fetch(
-                """
-                SELECT id, currency_code, precision, balance
-                FROM client_accounts
-                WHERE client_id=$1 AND is_active=TRUE
-                ORDER BY currency_code
-                """,
-                client_id,
-            )
-            return [dict(r) for r in rows]
+            rows = await con.fetch(SQL_SNAPSHOT_WALLET, client_id)
+        out = [dict(r) for r in rows]
+        for r in out:
+            r["currency_code"] = sys.intern(r["currency_code"])
+        return out
+
+    async def get_account(self, client_id: int, currency_code: str) -> dict[str, Any] | None:
+        code = to_upper(currency_code)
+        pool = await get_pool()
+        async with pool.acquire() as con:
+            row = await con.fetchrow(SQL_GET_ACCOUNT, client_id, code)
+            return dict(row) if row else None
 
     async def balances_by_client(self) -> list[dict[str, Any]]:
         pool = await get_pool()
@@ -254,4 +332,5 @@ class ClientsRepo:
                 """,
                 chat_id, client_group.strip(),
             )
-            return dict(row) if row else None
+        _client_ids.invalidate(int(chat_id))
+        return dict(row) if row else None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from db_asyncpg.hot_queries import SQL_IS_MANAGER, SQL_LIST_MANAGERS
 from db_asyncpg.pool import get_pool
 
 
@@ -7,7 +8,7 @@ class ManagersRepo:
     async def list_managers(self) -> list[dict]:
         pool = await get_pool()
         async with pool.acquire() as con:
-            rows = await con.fetch("SELECT user_id, display_name, added_at FROM managers ORDER BY added_at")
+            rows = await con.fetch(SQL_LIST_MANAGERS)
             return [dict(r) for r in rows]
 
     async def add_manager(self, user_id: int, display_name: str = "") -> bool:
@@ -20,7 +21,8 @@ class ManagersRepo:
                 ON CONFLICT (user_id) DO UPDATE
                   SET display_name = EXCLUDED.display_name
                 """,
-                user_id, display_name,
+                # храним уже обрезанным — список менеджеров выводит имя как есть
+                user_id, (display_name or "").strip(),
             )
             return res.startswith("INSERT") or res.startswith("UPDATE")
 
@@ -33,5 +35,5 @@ class ManagersRepo:
     async def is_manager(self, user_id: int) -> bool:
         pool = await get_pool()
         async with pool.acquire() as con:
-            row = await con.fetchrow("SELECT 1 FROM managers WHERE user_id=$1", user_id)
+            row = await con.fetchrow(SQL_IS_MANAGER, user_id)
             return row is not None
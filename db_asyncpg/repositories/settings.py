@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from db_asyncpg.hot_queries import SQL_GET_SETTING
 from db_asyncpg.pool import get_pool
 
 
 class SettingsRepo:
+    # таблица есть в schema.sql; CREATE IF NOT EXISTS — страховка, достаточно одного раза на процесс
+    _settings_table_ready = False
+
     async def _ensure_settings_table(self, con) -> None:
+        if SettingsRepo._settings_table_ready:
+            return
         await con.execute(
             """
             CREATE TABLE IF NOT EXISTS app_settings (
@@ -14,12 +20,13 @@ class SettingsRepo:
             )
             """
         )
+        SettingsRepo._settings_table_ready = True
 
     async def get_setting(self, key: str) -> str | None:
         pool = await get_pool()
         async with pool.acquire() as con:
             await self._ensure_settings_table(con)
-            row = await con.fetchrow("SELECT value FROM app_settings WHERE key=$1", key)
+            row = await con.fetchrow(SQL_GET_SETTING, key)
             return None if row is None else str(row["value"])
 
     async def set_setting(self, key: str, value: str) -> None:
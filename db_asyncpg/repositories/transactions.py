@@ -12,7 +12,27 @@ from db_asyncpg.utils import SqlParams, quantize_amount, to_upper
 
 
 class TransactionsRepo(BaseRepo):
-    async def _apply_delta(
+    async def _apply_delta(self, **kwargs) -> int:
+        res = await self._apply_delta_returning(**kwargs)
+        return res["transaction_id"]
+
+    @staticmethod
+    async def _existing_txn_result(con, *, client_id: int, txn_id: int, code: str) -> dict[str, Any]:
+        acc = await con.fetchrow(
+            """
+            SELECT precision, balance
+            FROM client_accounts
+            WHERE client_id=$1 AND currency_code=$2
+            """,
+            client_id, code,
+        )
+        return {
+            "transaction_id": txn_id,
+            "balance": acc["balance"] if acc else None,
+            "precision": acc["precision"] if acc else None,
+        }
+
+    async def _apply_delta_returning(
         self,
         *,
         client_id: int,
@@ -24,7 +44,12 @@ class TransactionsRepo(BaseRepo):
         source: str | None = None,
         txn_at: str | datetime | None = None,
         idempotency_key: str | None = None,
-    ) -> int:
+    ) -> dict[str, Any]:
+        """
+        Применяет изменение баланса и возвращает
+        {"transaction_id", "balance", "precision"} — баланс после операции,
+        чтобы вызывающему коду не нужен был повторный snapshot_wallet.
+        """
         code = to_upper(currency_code)
         pool = await get_pool()
         try:
@@ -36,7 +61,9 @@ class TransactionsRepo(BaseRepo):
                             client_id, idempotency_key,
                         )
                         if exist:
-                            return exist["id"]
+                            return await self._existing_txn_result(
+                                con, client_id=client_id, txn_id=exist["id"], code=code,
+                            )
 
                     acc = await con.fetchrow(
                         """
@@ -72,7 +99,11 @@ class TransactionsRepo(BaseRepo):
                         client_id, acc["id"], txn_at_norm, qamount, new_balance,
                         group_id, actor_id, comment, source, idempotency_key,
                     )
-                    return rec["id"]
+                    return {
+                        "transaction_id": rec["id"],
+                        "balance": new_balance,
+                        "precision": prec,
+                    }
         except UniqueViolationError:
             # Конкурентный дубликат: другая транзакция с тем же idempotency_key
             # успела закоммититься между нашим SELECT и INSERT (например, менеджер
@@ -87,18 +118,30 @@ class TransactionsRepo(BaseRepo):
                     "SELECT id FROM transactions WHERE client_id=$1 AND idempotency_key=$2",
                     client_id, idempotency_key,
                 )
-            if exist:
-                return exist["id"]
+                if exist:
+                    return await self._existing_txn_result(
+                        con, client_id=client_id, txn_id=exist["id"], code=code,
+                    )
             raise
 
     async def deposit(self, **kwargs) -> int:
         return await self._apply_delta(**kwargs)
 
     async def withdraw(self, **kwargs) -> int:
+        return await self._apply_delta(**self._negate_amount(kwargs))
+
+    async def deposit_with_balance(self, **kwargs) -> dict[str, Any]:
+        return await self._apply_delta_returning(**kwargs)
+
+    async def withdraw_with_balance(self, **kwargs) -> dict[str, Any]:
+        return await self._apply_delta_returning(**self._negate_amount(kwargs))
+
+    @staticmethod
+    def _negate_amount(kwargs: dict[str, Any]) -> dict[str, Any]:
         if "amount" in kwargs:
             kwargs = dict(kwargs)
             kwargs["amount"] = -Decimal(str(kwargs["amount"]))
-        return await self._apply_delta(**kwargs)
+        return kwargs
 
     async def history(
         self,
@@ -40,7 +40,11 @@ def to_upper(code: str) -> str:
     return (code or "").upper()
 
 
+# Шаги округления для допустимых точностей счёта (CHECK precision BETWEEN 0 AND 8)
+_QUANTS = tuple(Decimal(1).scaleb(-p) for p in range(9))
+
+
 def quantize_amount(value: Decimal | str | int | float, precision: int) -> Decimal:
-    d = Decimal(str(value))
-    q = Decimal(10) ** (-precision)
+    d = value if isinstance(value, Decimal) else Decimal(str(value))
+    q = _QUANTS[precision] if 0 <= precision < len(_QUANTS) else Decimal(10) ** (-precision)
     return d.quantize(q, rounding=ROUND_HALF_UP)
@@ -30,7 +30,8 @@ class SheetsNotConfigured(RuntimeError): ...
 class SheetsReadError(RuntimeError): ...
 
 
-_THOUSAND_SEPS = {" ", "\u00A0", "\u202F", "\u2009", "'", "’", "ʼ", "‛", "`"}
+# Разделители разрядов удаляются, запятая становится точкой — за один проход.
+_AMOUNT_TRANS = str.maketrans(",", ".", " \u00A0\u202F\u2009'’ʼ‛`")
 
 # <<< НОВОЕ: карта валют -> A1-ячейки на листе «Главная» >>>
 # Можно переопределить через JSON в GOOGLE_BALANCE_CELLS_JSON
@@ -52,10 +53,7 @@ def _norm_code(code: str) -> str:
 
 
 def _to_decimal(s: str) -> Decimal:
-    x = s
-    for ch in _THOUSAND_SEPS:
-        x = x.replace(ch, "")
-    x = x.replace(",", ".").strip()
+    x = s.translate(_AMOUNT_TRANS).strip()
     if x == "":
         return Decimal("0")
     try:
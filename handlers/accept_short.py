@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
 from typing import cast
 
@@ -16,6 +17,13 @@ from utils.auth import (
     require_manager_or_admin_message,
 )
 
+_ACCEPT_COMMANDS = ("пд", "пе", "пт", "пр", "пб", "пп", "прмск", "прспб", "прпер")
+# fallback для регистра/чужого @упоминания — собран из того же списка команд
+_RE_ACCEPT_FALLBACK = re.compile(
+    r"^/(" + "|".join(_ACCEPT_COMMANDS) + r")(?:@\w+)?\b",
+    re.I | re.U,
+)
+
 
 def _is_forwarded_message(message: Message) -> bool:
     return any(
@@ -55,8 +63,8 @@ class AcceptShortHandler:
             request_chat_id=request_chat_id,
             act_counter_service=act_counter_service,
         )
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.ignore_chat_ids = set(ignore_chat_ids or set())
         self.router = Router()
         self._register()
@@ -93,17 +101,10 @@ class AcceptShortHandler:
         await self.service.handle_cancel(cq)
 
     def _register(self) -> None:
-        self.router.message.register(self._cmd_accept_short, Command("пд"))
-        self.router.message.register(self._cmd_accept_short, Command("пе"))
-        self.router.message.register(self._cmd_accept_short, Command("пт"))
-        self.router.message.register(self._cmd_accept_short, Command("пр"))
-        self.router.message.register(self._cmd_accept_short, Command("пб"))
-        self.router.message.register(self._cmd_accept_short, Command("пп"))
-        self.router.message.register(self._cmd_accept_short, Command("прмск"))
-        self.router.message.register(self._cmd_accept_short, Command("прспб"))
-        self.router.message.register(self._cmd_accept_short, Command("прпер"))
+        # один Command на все короткие команды вместо девяти отдельных фильтров
+        self.router.message.register(self._cmd_accept_short, Command(*_ACCEPT_COMMANDS))
         self.router.message.register(
             self._cmd_accept_short,
-            F.text.regexp(r"(?iu)^/(пд|пе|пт|пр|пб|прмск|прспб|прпер|пп)(?:@\w+)?\b"),
+            F.text.regexp(_RE_ACCEPT_FALLBACK),
         )
         self.router.callback_query.register(self._cb_cancel, F.data.startswith("req_cancel:"))
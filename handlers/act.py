@@ -26,9 +26,9 @@ class ActHandler:
     ) -> None:
         self.repo = repo
         self.act_counter_service = act_counter_service
-        self.request_chat_ids = set(request_chat_ids or [])
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.request_chat_ids = frozenset(request_chat_ids or ())
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.text_builder = ActCounterTextBuilder()
         self.router = Router()
         self._register()
@@ -17,11 +17,13 @@ from aiogram.types import Message
 from db_asyncpg.repo import Repo
 from services.cash_requests import post_request_message
 from utils.calc import CalcError, evaluate
-from utils.formatting import format_amount_core
+from utils.formatting import format_amount_core, quantum
 from utils.info import _fmt_rate
 
 log = logging.getLogger(__name__)
 
+_RE_ADMIN_REQUEST_CMD = re.compile(r"(?iu)^/заявка(?:@\w+)?\b")
+
 
 class AdminRequestHandler:
     """
@@ -66,7 +68,7 @@ class AdminRequestHandler:
 
     def _register(self) -> None:
         self.router.message.register(self._cmd_admin_request, Command("заявка"))
-        self.router.message.register(self._cmd_admin_request, F.text.regexp(r"(?iu)^/заявка(?:@\w+)?\b"))
+        self.router.message.register(self._cmd_admin_request, F.text.regexp(_RE_ADMIN_REQUEST_CMD))
 
     async def _cmd_admin_request(self, message: Message) -> None:
         # Только в админском чате
@@ -136,8 +138,8 @@ class AdminRequestHandler:
         pay_prec = pay_prec if pay_prec is not None else default_precision(pay_code)
 
         # Квантуем для вывода
-        q_recv = Decimal(10) ** -recv_prec
-        q_pay = Decimal(10) ** -pay_prec
+        q_recv = quantum(recv_prec)
+        q_pay = quantum(pay_prec)
         recv_q = recv_raw.quantize(q_recv, rounding=ROUND_HALF_UP)
         pay_q = pay_raw .quantize(q_pay,  rounding=ROUND_HALF_UP)
 
@@ -158,7 +160,7 @@ class AdminRequestHandler:
             return
 
         # Карточка заявки
-        req_id = random.randint(10_000_000, 99_999_999)
+        req_id = 10_000_000 + random.randrange(90_000_000)
         pretty_recv = format_amount_core(recv_q, recv_prec)
         pretty_pay = format_amount_core(pay_q,  pay_prec)
 
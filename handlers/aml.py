@@ -27,8 +27,8 @@ class AMLHandler:
     ) -> None:
         self.repo = repo
         self.aml_queue_service = aml_queue_service
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.router = Router()
         self._register()
 
@@ -23,7 +23,7 @@ class ClientsBalancesHandler:
         admin_chat_ids: Iterable[int] | None = None,
     ) -> None:
         self.report_service = report_service
-        self.admin_chat_ids = set(admin_chat_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
         self.router = Router()
         self._register()
 
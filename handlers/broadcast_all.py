@@ -23,8 +23,8 @@ class BroadcastAllHandler:
         admin_user_ids: set[int] | None = None,
     ) -> None:
         self.repo = repo
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.router = Router()
         self.session_store = BroadcastSessionStore()
         self.broadcast_service = BroadcastService(repo=repo)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from uuid import uuid4
 
@@ -14,6 +15,9 @@ from aiogram.types import (
 
 from utils.calc import CalcError, evaluate
 
+# /2+2, /-5*3, /(1+2) — выражение сразу после слэша
+_RE_SLASH_CALC = re.compile(r"^/[+\-0-9(]")
+
 
 def _fmt_decimal_smart(d: Decimal) -> str:
     """
@@ -149,5 +153,6 @@ class CalcHandler:
 
     def _register(self) -> None:
         self.router.message.register(_cmd_calc, Command("calc"))
-        self.router.message.register(_slash_calc, F.text.regexp(r"^/[+\-0-9(]"))
-        self.router.inline_query.register(_on_inline, F.query.regexp(r".*"))
+        self.router.message.register(_slash_calc, F.text.regexp(_RE_SLASH_CALC))
+        # любой inline-запрос — калькулятор; фильтр «.*» только тратил regex-проход на каждый запрос
+        self.router.inline_query.register(_on_inline)
@@ -40,8 +40,8 @@ class CashRequestsHandler:
         default_city: str = "екб",
     ) -> None:
         self.repo = repo
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         schedule_repo = cast(RequestScheduleRepositoryPort, repo)
         managed_wallet_schedule_repo = cast(ManagedClientWalletScheduleRepositoryPort, repo)
         managed_wallet_tx_repo = cast(ManagedClientWalletTransactionRepositoryPort, repo)
@@ -106,7 +106,7 @@ class CashRequestsHandler:
     def _register(self) -> None:
         self.router.message.register(
             self.request_service.handle,
-            Command(*self.request_service.supported_commands),
+            Command(self.request_service.command_pattern),
         )
         self.router.message.register(
             self.request_time_service.handle,
@@ -14,7 +14,7 @@ class CityAssignHandler:
 
     def __init__(self, service: ClientGroupService, admin_chat_ids: Iterable[int] | None = None) -> None:
         self.service = service
-        self.admin_chat_ids = set(admin_chat_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
         self.router = Router()
         self._register()
 
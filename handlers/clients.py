@@ -22,7 +22,7 @@ class ClientsHandler:
 
     def __init__(self, service: ClientDirectoryService, admin_chat_ids: Iterable[int] | None = None) -> None:
         self.service = service
-        self.admin_chat_ids = set(admin_chat_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
         self.router = Router()
         self._register()
 
@@ -76,9 +76,7 @@ class ClientsHandler:
         if answer == "no":
             old = cq.message.text or ""
             with suppress_telegram_edit_errors(context="rmclient cancel"):
-                await cq.message.edit_text(old + "\nОтменено.", parse_mode="HTML")
-            with suppress_telegram_edit_errors(context="rmclient cancel"):
-                await cq.message.edit_reply_markup(reply_markup=None)
+                await cq.message.edit_text(old + "\nОтменено.", parse_mode="HTML", reply_markup=None)
             await cq.answer("Отмена")
             return
 
@@ -89,9 +87,7 @@ class ClientsHandler:
             await cq.answer(f"Ошибка: {e}", show_alert=True)
             return
         with suppress_telegram_edit_errors(context="rmclient confirm"):
-            await cq.message.edit_text(new_text, parse_mode="HTML")
-        with suppress_telegram_edit_errors(context="rmclient confirm"):
-            await cq.message.edit_reply_markup(reply_markup=None)
+            await cq.message.edit_text(new_text, parse_mode="HTML", reply_markup=None)
         await cq.answer("Готово")
 
     def _register(self) -> None:
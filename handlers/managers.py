@@ -18,7 +18,8 @@ class ManagersHandler:
         self._register()
 
     def _allowed(self, m: Message) -> bool:
-        return bool(m.chat and m.chat.id == self.admin_chat_id)
+        # Message.chat в aiogram обязателен — достаточно одного сравнения int
+        return m.chat.id == self.admin_chat_id
 
     async def _cmd_mgr(self, message: Message) -> None:
         if not self._allowed(message):
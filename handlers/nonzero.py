@@ -1,12 +1,12 @@
 # handlers/nonzero.py
 from aiogram import F, Router
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.types import CallbackQuery, Message
 
 from services.admin_client import NonZeroWalletQueryService
 
 # выписки (общий модуль)
-from utils.statements import statements_kb
+from utils.statements import STMT_CALLBACKS, statements_kb
 
 
 class NonZeroHandler:
@@ -22,10 +22,10 @@ class NonZeroHandler:
         self.router = Router()
         self._register()
 
-    async def _cmd_give(self, message: Message) -> None:
+    async def _cmd_give(self, message: Message, command: CommandObject) -> None:
         await message.answer(
             await self.service.build_wallet_message(
-                command_text=message.text or "",
+                arg_code=self.service.arg_code_from_args(command.args),
                 chat_id=message.chat.id,
                 chat_name=self.service.chat_name_from_message(message),
             ),
@@ -38,11 +38,7 @@ class NonZeroHandler:
         await self.service.handle_statement_callback(cq)
 
     def _register(self) -> None:
-        self.router.message.register(self._cmd_give, Command("дай"))
-        # поддержка формы с аргументом по regex
-        self.router.message.register(
-            self._cmd_give,
-            F.text.regexp(r"(?iu)^/дай(?:@\w+)?(?:\s+\S+)?\s*$"),
-        )
+        # Единственный маршрут: Command сам разбирает /дай[@bot] [аргумент], повторный regex не нужен
+        self.router.message.register(self._cmd_give, Command("дай", ignore_case=True))
         # обработка коллбэков выписок
-        self.router.callback_query.register(self._cb_statement, F.data.in_({"stmt:month", "stmt:all"}))
+        self.router.callback_query.register(self._cb_statement, F.data.in_(STMT_CALLBACKS))
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from aiogram import Router
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.types import FSInputFile, Message
 
 log = logging.getLogger(__name__)
@@ -39,33 +39,44 @@ class OfficeCardsHandler:
     def __init__(self, cards: Mapping[str, OfficeCard]) -> None:
         self.router = Router()
         self.cards: dict[str, OfficeCard] = {
-            k.strip().lower(): v for k, v in cards.items()
+            k.strip().casefold(): v for k, v in cards.items()
         }
+        self._cmd_keys = frozenset(self.cards)
+        # Картинки статичны (деплой): проверяем наличие файла один раз, а не stat() на каждую отправку
+        self._input_files: dict[str, FSInputFile] = {}
+        for cmd, card in self.cards.items():
+            if card.photo_file_id or not card.image_path:
+                continue
+            if card.image_path.is_file():
+                self._input_files[cmd] = FSInputFile(card.image_path)
+            else:
+                log.warning("office_cards: image not found for /%s: %s", cmd, card.image_path.as_posix())
+        # file_id, полученные после первого аплоада image_path: дальше файл не перезаливаем
+        self._fid_cache: dict[str, str] = {}
         self._register()
 
     def _register(self) -> None:
-        for cmd in self.cards:
-            self.router.message.register(
-                self._send_card,
-                Command(cmd, ignore_mention=True),
-            )
-
-    async def _send_card(self, message: Message) -> None:
-        text = (message.text or "").strip()
-        if not text.startswith("/"):
+        if not self._cmd_keys:
             return
+        # Один фильтр на все карточки: команду разбираем один раз, а не в N зарегистрированных хендлерах.
+        self.router.message.register(
+            self._send_card,
+            Command(*self._cmd_keys, ignore_mention=True),
+        )
 
-        cmd_token = text[1:].split(None, 1)[0]
-        cmd = cmd_token.split("@", 1)[0].strip().lower()
+    async def _send_card(self, message: Message, command: CommandObject) -> None:
+        # Command-фильтр уже разобрал /cmd@bot и пропускает только ключи из _cmd_keys
+        cmd = command.command
 
         card = self.cards.get(cmd)
         if not card:
             return
 
-        # 1) отправка по file_id
-        if card.photo_file_id:
+        # 1) отправка по file_id (заданному или запомненному после аплоада)
+        photo_file_id = card.photo_file_id or self._fid_cache.get(cmd)
+        if photo_file_id:
             await message.answer_photo(
-                photo=card.photo_file_id,
+                photo=photo_file_id,
                 caption=card.caption,
                 parse_mode="HTML",
             )
@@ -73,20 +84,22 @@ class OfficeCardsHandler:
 
         # 2) fallback на локальный файл
         if card.image_path:
-            if not card.image_path.exists():
+            input_file = self._input_files.get(cmd)
+            if input_file is None:
                 await message.answer(
                     f"Файл не найден: {card.image_path.as_posix()}",
                 )
                 return
 
             sent = await message.answer_photo(
-                photo=FSInputFile(card.image_path),
+                photo=input_file,
                 caption=card.caption,
                 parse_mode="HTML",
             )
 
             if sent.photo:
                 fid = sent.photo[-1].file_id
+                self._fid_cache[cmd] = fid
                 log.info(
                     "office_cards new photo_file_id: command=/%s photo_file_id=%s",
                     cmd,
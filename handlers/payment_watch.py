@@ -25,8 +25,8 @@ class PaymentWatchHandler:
     ) -> None:
         self.repo = repo
         self.payment_watch_service = payment_watch_service
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.router = Router()
         self._register()
 
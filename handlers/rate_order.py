@@ -29,8 +29,8 @@ class RateOrderHandler:
     ) -> None:
         self.repo = repo
         self.rate_order_service = rate_order_service
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.orders_chat_id = int(orders_chat_id)
         self.router = Router()
         self._register()
@@ -11,7 +11,9 @@ from services.admin_client import UsdtWalletService
 class UsdtWalletHandler:
     def __init__(self, service: UsdtWalletService, *, admin_chat_ids: set[int] | None = None) -> None:
         self.service = service
-        self.admin_chat_ids = set(admin_chat_ids or [])
+        self.admin_chat_ids: frozenset[int] = frozenset(admin_chat_ids or ())
+        # пустой список админ-чатов — ограничение выключено
+        self._restrict_admins = bool(self.admin_chat_ids)
         self.router = Router()
         self._register()
 
@@ -23,7 +25,7 @@ class UsdtWalletHandler:
     # --- задать адрес ---
     async def _cmd_set(self, message: Message) -> None:
         # менять можно только из админского чата
-        if self.admin_chat_ids and message.chat.id not in self.admin_chat_ids:
+        if self._restrict_admins and message.chat.id not in self.admin_chat_ids:
             await message.answer("Эту команду можно использовать только в админском чате.")
             return
 
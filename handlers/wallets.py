@@ -20,9 +20,11 @@ from utils.auth import (
 )
 from utils.errors import suppress_telegram_edit_errors
 from utils.locks import chat_locks
-from utils.statements import handle_stmt_callback
+from utils.statements import STMT_CALLBACKS, handle_stmt_callback
 
-_RE_PUBLIC_WALLET_CMD = r"(?iu)^/кош(?:@\w+)?(?:\s|$)"
+_RE_PUBLIC_WALLET_CMD = re.compile(r"(?iu)^/кош(?:@\w+)?(?:\s|$)")
+# /КОД <выражение> — общий скомпилированный шаблон для фильтров по тексту и подписи
+_RE_CURRENCY_CMD = re.compile(r"^/[A-Za-zА-Яа-я0-9_]+\s+")
 
 
 class WalletsHandler:
@@ -37,11 +39,11 @@ class WalletsHandler:
         city_cash_chat_ids: Iterable[int] | None = None,
     ) -> None:
         self.repo = repo
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.request_chat_id = int(request_chat_id) if request_chat_id is not None else None
-        self.ignore_chat_ids = set(ignore_chat_ids or [])
-        self.city_cash_chat_ids = set(city_cash_chat_ids or [])
+        self.ignore_chat_ids = frozenset(ignore_chat_ids or ())
+        self.city_cash_chat_ids = frozenset(city_cash_chat_ids or ())
         self._background_tasks: set[asyncio.Task[None]] = set()
         self.city_cash_media_store = CityCashMediaStore()
         wallet_repo = cast(ClientTransferRepositoryPort, repo)
@@ -58,12 +60,12 @@ class WalletsHandler:
         await asyncio.sleep(0.8)
         async with chat_locks.for_chat(message.chat.id):
             result = await self.interaction_service.build_currency_change_response(message)
-            if not result:
-                return
-            await message.answer(
-                result.message_text,
-                reply_markup=result.reply_markup,
-            )
+        if not result:
+            return
+        await message.answer(
+            result.message_text,
+            reply_markup=result.reply_markup,
+        )
 
     @manager_or_admin_message_required
     async def _cmd_wallet(self, message: Message) -> None:
@@ -122,10 +124,12 @@ class WalletsHandler:
             and message.bot
             and reply.from_user
             and reply.from_user.id == message.bot.id
-            and re.match(_RE_PUBLIC_WALLET_CMD, text.strip())
+            and _RE_PUBLIC_WALLET_CMD.match(text.strip())
         ):
             return
 
+        # ensure_client и любые записи в БД — только после проверки прав:
+        # фильтр ловит любое «/слово арг», в том числе от посторонних участников чата
         if not await require_manager_or_admin_message(
             self.repo,
             message,
@@ -134,15 +138,17 @@ class WalletsHandler:
         ):
             return
 
+        # под блокировкой — только работа с БД; ответ в Telegram уже вне её,
+        # чтобы следующая команда этого чата не ждала сетевой вызов к Bot API
         async with chat_locks.for_chat(message.chat.id):
             result = await self.interaction_service.build_currency_change_response(message)
-            if not result:
-                return
+        if not result:
+            return
 
-            await message.answer(
-                result.message_text,
-                reply_markup=result.reply_markup,
-            )
+        await message.answer(
+            result.message_text,
+            reply_markup=result.reply_markup,
+        )
 
     async def _buffer_city_cash_media_group(self, message: Message) -> None:
         if not message.media_group_id or not message.photo:
@@ -198,16 +204,15 @@ class WalletsHandler:
                 amt_str=amt_str,
             )
 
+        # editMessageText без клавиатуры снимает её сам — второй вызов к Bot API не нужен
+        with suppress_telegram_edit_errors(context="wallet undo"):
             if result.ok:
-                old_text = cq.message.text or ""
-                with suppress_telegram_edit_errors(context="wallet undo"):
-                    await cq.message.edit_text(old_text + "\n↩️ Отменено.")
-
-            with suppress_telegram_edit_errors(context="wallet undo"):
+                await cq.message.edit_text((cq.message.text or "") + "\n↩️ Отменено.", reply_markup=None)
+            else:
                 await cq.message.edit_reply_markup(reply_markup=None)
 
-            await cq.message.answer(result.message_text, parse_mode="HTML")
-            await cq.answer("Откат выполнен" if result.ok else result.message_text[:100], show_alert=not result.ok)
+        await cq.message.answer(result.message_text, parse_mode="HTML")
+        await cq.answer("Откат выполнен" if result.ok else result.message_text[:100], show_alert=not result.ok)
 
     async def _cb_statement(self, cq: CallbackQuery) -> None:
         await handle_stmt_callback(cq, cast(ClientTransactionRepositoryPort, self.repo))
@@ -219,11 +224,11 @@ class WalletsHandler:
 
         self.router.message.register(
             self._on_currency_change,
-            F.text.regexp(r"^/[A-Za-zА-Яа-я0-9_]+\s+"),
+            F.text.regexp(_RE_CURRENCY_CMD),
         )
         self.router.message.register(
             self._on_currency_change,
-            F.caption.regexp(r"^/[A-Za-zА-Яа-я0-9_]+\s+"),
+            F.caption.regexp(_RE_CURRENCY_CMD),
         )
         self.router.message.register(
             self._buffer_city_cash_media_group,
@@ -232,4 +237,4 @@ class WalletsHandler:
 
         self.router.callback_query.register(self._cb_rmcur, F.data.startswith("rmcur:"))
         self.router.callback_query.register(self._cb_undo, F.data.startswith("undo:"))
-        self.router.callback_query.register(self._cb_statement, F.data.in_({"stmt:month", "stmt:all"}))
+        self.router.callback_query.register(self._cb_statement, F.data.in_(STMT_CALLBACKS))
@@ -27,8 +27,8 @@ class XEHandler:
         admin_user_ids: Iterable[int] | None = None,
     ) -> None:
         self.repo = repo
-        self.admin_chat_ids = set(admin_chat_ids or [])
-        self.admin_user_ids = set(admin_user_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
+        self.admin_user_ids = frozenset(admin_user_ids or [])
         self.converter_service = converter_service
         self.formatter = ResponseFormatter()
         self.router = Router()
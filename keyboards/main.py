@@ -1,10 +1,14 @@
 # keyboards/main.py
+from functools import lru_cache
+
 from aiogram.types import KeyboardButton, ReplyKeyboardMarkup
 
 
 class MainKeyboard:
     @staticmethod
+    @lru_cache(maxsize=1)
     def main() -> ReplyKeyboardMarkup:
+        """Статичная клавиатура — собираем один раз и переиспользуем."""
         return ReplyKeyboardMarkup(
             keyboard=[
                 [KeyboardButton(text="/помоги")],
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
@@ -17,7 +18,13 @@ CB_TABLE_DEL_YES = "req:table_del:yes"
 CB_TABLE_DEL_NO = "req:table_del:no"
 
 
+@lru_cache(maxsize=256)
 def deal_kb(req_id: str) -> InlineKeyboardMarkup:
+    """
+    Кнопки сделки для карточки в чате заявок.
+    Разметка зависит только от req_id, поэтому при правках той же заявки
+    переиспользуется уже собранный объект (его никто не мутирует).
+    """
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
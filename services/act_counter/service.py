@@ -25,7 +25,7 @@ class ActCounterService:
         )
         rows = await self.repo.snapshot_wallet(client_id)
         for row in rows:
-            if str(row["currency_code"]).upper() == self.USDT_CODE:
+            if row["currency_code"] == self.USDT_CODE:
                 return Decimal(str(row["balance"]))
         return Decimal("0")
 
@@ -187,6 +187,6 @@ class ActCounterService:
             name=(chat_name or f"ACT {request_chat_id}"),
         )
         rows = await self.repo.snapshot_wallet(client_id)
-        if not any(str(row["currency_code"]).upper() == self.USDT_CODE for row in rows):
+        if not any(row["currency_code"] == self.USDT_CODE for row in rows):
             await self.repo.add_currency(client_id, self.USDT_CODE, self.USDT_PRECISION)
         return client_id
@@ -18,12 +18,9 @@ class ClientBootstrapService:
         self.repo = repo
 
     async def ensure_client_wallet(self, *, chat_id: int, chat_name: str) -> int:
+        # ensure_client для уже известного чата отвечает из кеша репозитория, без похода в БД
         client_id = await self.repo.ensure_client(chat_id=chat_id, name=chat_name)
-        rows = await self.repo.snapshot_wallet(client_id)
-        existing_codes = {str(row["currency_code"]).upper() for row in rows}
-
-        for code, precision in DEFAULT_CURRENCIES:
-            if code.upper() not in existing_codes:
-                await self.repo.add_currency(client_id, code, precision)
+        # недостающие валюты по умолчанию — одним INSERT ... SELECT unnest, без snapshot и цикла add_currency
+        await self.repo.ensure_accounts(client_id, DEFAULT_CURRENCIES)
 
         return client_id
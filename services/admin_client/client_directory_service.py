@@ -10,16 +10,20 @@ class ClientDirectoryService:
         self.repo = repo
 
     @staticmethod
-    def _chunk(text: str, limit: int = 3500) -> list[str]:
-        out, cur, total = [], [], 0
-        for line in text.splitlines(True):
-            if total + len(line) > limit and cur:
-                out.append("".join(cur))
+    def _chunk_lines(lines: list[str], limit: int = 3500) -> list[str]:
+        """Склеивает готовые строки в сообщения до limit символов, не собирая общий текст."""
+        out: list[str] = []
+        cur: list[str] = []
+        total = 0
+        for line in lines:
+            size = len(line) + 1  # + "\n" при склейке
+            if total + size > limit and cur:
+                out.append("\n".join(cur))
                 cur, total = [], 0
             cur.append(line)
-            total += len(line)
+            total += size
         if cur:
-            out.append("".join(cur))
+            out.append("\n".join(cur))
         return out
 
     @staticmethod
@@ -46,18 +50,18 @@ class ClientDirectoryService:
             return ["Нет активных клиентов."]
 
         lines: list[str] = [title]
-        for client in sorted(clients, key=lambda item: (item.get("name") or "").lower()):
+        # list_clients* уже отдают клиентов, отсортированных по имени без учёта регистра.
+        for client in clients:
             name = html.escape(client.get("name") or "")
-            client_group = html.escape(client.get("client_group") or "")
+            client_group = client.get("client_group")
             chat_id = client["chat_id"]
 
-            line = f"{name}"
             if client_group:
-                line += f" — {client_group}"
-            line += f"\n    chat_id = <code>{chat_id}</code>"
-            lines.append(line)
+                lines.append(f"{name} — {html.escape(client_group)}\n    chat_id = <code>{chat_id}</code>")
+            else:
+                lines.append(f"{name}\n    chat_id = <code>{chat_id}</code>")
 
-        return self._chunk("\n".join(lines))
+        return self._chunk_lines(lines)
 
     @staticmethod
     def build_remove_confirmation(chat_id: int) -> str:
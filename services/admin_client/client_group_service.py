@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import html
-import re
 
 from db_asyncpg.ports import ClientRepositoryPort
 
@@ -11,20 +10,17 @@ class ClientGroupService:
         self.repo = repo
 
     async def assign_from_text(self, text: str) -> str:
-        text = (text or "").strip()
-        match = re.match(r"^/группа(?:@\w+)?\s+(-?\d+)\s+(.+)$", text, flags=re.IGNORECASE | re.UNICODE)
-        if not match:
+        # Префикс /группа[@bot] уже проверен фильтром Command — дальше хватает split.
+        parts = (text or "").split(maxsplit=2)
+        raw_chat_id = parts[1] if len(parts) == 3 else ""
+        if not raw_chat_id.removeprefix("-").isdecimal() or "\n" in parts[2].strip():
             return (
                 "Использование: /группа <chat_id> <группа>\n"
                 "Пример: /группа 123456789 VIP"
             )
 
-        try:
-            target_chat_id = int(match.group(1))
-        except ValueError:
-            return "Некорректный chat_id."
-
-        client_group = match.group(2).strip()
+        target_chat_id = int(raw_chat_id)
+        client_group = parts[2].strip()
         if not client_group:
             return "Укажите группу после chat_id."
 
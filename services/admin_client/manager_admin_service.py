@@ -5,6 +5,12 @@ import re
 
 from db_asyncpg.ports import ManagerRepositoryPort
 
+_RE_MGR_ADD = re.compile(r"^/mgr(?:@\w+)?\s*\+\s+(\d+)(?:\s+(.+))?$", re.I | re.U)
+_RE_MGR_DEL = re.compile(r"^/mgr(?:@\w+)?\s*-\s+(\d+)\s*$", re.I | re.U)
+
+# Имена идут только в текст сообщения (не в атрибуты) — хватает &, <, >; translate быстрее html.escape
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 
 class ManagerAdminService:
     def __init__(self, repo: ManagerRepositoryPort) -> None:
@@ -13,7 +19,7 @@ class ManagerAdminService:
     async def handle_command(self, text: str) -> str:
         text = (text or "").strip()
 
-        m_add = re.match(r"^/mgr(?:@\w+)?\s*\+\s+(\d+)(?:\s+(.+))?$", text, flags=re.I | re.U)
+        m_add = _RE_MGR_ADD.match(text)
         if m_add:
             user_id = int(m_add.group(1))
             display_name = (m_add.group(2) or "").strip()
@@ -25,7 +31,7 @@ class ManagerAdminService:
                 else "❌ Не удалось добавить менеджера."
             )
 
-        m_del = re.match(r"^/mgr(?:@\w+)?\s*-\s+(\d+)\s*$", text, flags=re.I | re.U)
+        m_del = _RE_MGR_DEL.match(text)
         if m_del:
             user_id = int(m_del.group(1))
             ok = await self.repo.remove_manager(user_id=user_id)
@@ -39,9 +45,13 @@ class ManagerAdminService:
         if not managers:
             return "Список менеджеров пуст."
 
-        lines = ["Менеджеры:"]
-        for manager in managers:
-            uid = manager["user_id"]
-            name = (manager.get("display_name") or "").strip()
-            lines.append(f"• <code>{uid}</code>{(' — ' + html.escape(name)) if name else ''}")
-        return "\n".join(lines)
+        return "Менеджеры:\n" + "\n".join(
+            self._manager_line(m["user_id"], m.get("display_name") or "")
+            for m in managers
+        )
+
+    @staticmethod
+    def _manager_line(uid: int, name: str) -> str:
+        if name:
+            return f"• <code>{uid}</code> — {name.translate(_HTML_ESCAPE_TABLE)}"
+        return f"• <code>{uid}</code>"
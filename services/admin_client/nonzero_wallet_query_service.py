@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import html
-import re
+from functools import lru_cache
 
 from aiogram.types import CallbackQuery
 
 from db_asyncpg.ports import ClientWalletTransactionRepositoryPort
-from utils.format_wallet_compact import format_wallet_compact
+from utils.format_wallet_compact import format_wallet_compact, wallet_block_html
 from utils.info import get_chat_name
 from utils.statements import handle_stmt_callback
 
@@ -46,18 +45,23 @@ class NonZeroWalletQueryService:
         self.repo = repo
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _display_code_ru(code: str) -> str:
         return _DISPLAY_NAMES_RU.get(code.upper(), code).lower()
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _normalize_code_alias(raw: str) -> str:
         key = (raw or "").strip().lower()
         return _CURRENCY_ALIASES.get(key, (raw or "").strip().upper())
 
-    async def build_wallet_message(self, *, command_text: str, chat_id: int, chat_name: str) -> str:
-        match = re.match(r"(?iu)^/дай(?:@\w+)?(?:\s+(\S+))?\s*$", (command_text or "").strip())
-        arg_code = match.group(1) if match else None
+    @staticmethod
+    def arg_code_from_args(args: str | None) -> str | None:
+        # /дай <валюта> — ровно один аргумент; иначе показываем все ненулевые счета
+        tokens = (args or "").split()
+        return tokens[0] if len(tokens) == 1 else None
 
+    async def build_wallet_message(self, *, arg_code: str | None, chat_id: int, chat_name: str) -> str:
         client_id = await self.repo.ensure_client(chat_id, chat_name)
         rows = await self.repo.snapshot_wallet(client_id)
         if not rows:
@@ -65,7 +69,7 @@ class NonZeroWalletQueryService:
 
         if arg_code:
             code = self._normalize_code_alias(arg_code)
-            acc = next((row for row in rows if str(row["currency_code"]).upper() == code), None)
+            acc = next((row for row in rows if row["currency_code"] == code), None)
             if not acc:
                 return f"Счёт {code} не найден. Добавьте валюту: /добавь {code} [точность]"
 
@@ -74,24 +78,24 @@ class NonZeroWalletQueryService:
                 "balance": acc.get("balance"),
                 "precision": int(acc.get("precision", 2)),
             }]
-            compact_one = format_wallet_compact(single_row, only_nonzero=False)
-            safe_title = html.escape(f"Средств у {chat_name}:")
-            safe_rows = html.escape(compact_one)
-            return f"<code>{safe_title}\n\n{safe_rows}</code>"
-
-        renamed = []
-        for row in rows:
-            item = dict(row)
-            item["currency_code"] = self._display_code_ru(str(row["currency_code"]))
-            renamed.append(item)
-
-        compact = format_wallet_compact(renamed, only_nonzero=True)
+            compact_one = format_wallet_compact(single_row, only_nonzero=False, html_safe=True)
+            return wallet_block_html(chat_name, compact_one)
+
+        # format_wallet_compact нужны только эти три поля — полную строку не копируем
+        renamed = [
+            {
+                "currency_code": self._display_code_ru(row["currency_code"]),
+                "balance": row["balance"],
+                "precision": row["precision"],
+            }
+            for row in rows
+        ]
+
+        compact = format_wallet_compact(renamed, only_nonzero=True, html_safe=True)
         if compact == "Пусто":
             return "Все счета нулевые. Посмотреть всё: /кошелек"
 
-        safe_title = html.escape(f"Средств у {chat_name}:")
-        safe_rows = html.escape(compact)
-        return f"<code>{safe_title}\n\n{safe_rows}</code>"
+        return wallet_block_html(chat_name, compact)
 
     async def handle_statement_callback(self, cq: CallbackQuery) -> None:
         await handle_stmt_callback(cq, self.repo)
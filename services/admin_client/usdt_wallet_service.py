@@ -1,32 +1,56 @@
 from __future__ import annotations
 
 import html
+import re
+import time
 
 from db_asyncpg.ports import SettingsRepositoryPort
 
 SETTING_KEY = "USDT_WALLET"
+_NOT_SET_TEXT = "USDT-кошелёк пока не задан."
+# адрес меняется редко, а /кош — самая частая команда: держим готовый ответ в памяти
+_SHOW_CACHE_TTL = 300.0
+_MIN_ADDR_LEN = 26
+_MAX_ADDR_LEN = 128
+# TRC20 (base58) и ERC20 (hex) — только латиница и цифры, экранировать в HTML нечего
+_SAFE_ADDR_RE = re.compile(r"[A-Za-z0-9]+")
 
 
 class UsdtWalletService:
     def __init__(self, repo: SettingsRepositoryPort) -> None:
         self.repo = repo
+        # (готовое сообщение, момент истечения по time.monotonic)
+        self._show_cache: tuple[str, float] | None = None
 
-    async def build_show_message(self) -> str:
-        addr = await self.repo.get_setting(SETTING_KEY)
+    @staticmethod
+    def _render(addr: str | None) -> str:
         if not addr:
-            return "USDT-кошелёк пока не задан."
-        return (
-            f"<code>{html.escape(addr)}</code>"
-        )
+            return _NOT_SET_TEXT
+        if _SAFE_ADDR_RE.fullmatch(addr) is None:
+            # адрес, сохранённый до проверки набора символов
+            addr = html.escape(addr)
+        return f"<code>{addr}</code>"
+
+    def _remember(self, text: str) -> str:
+        self._show_cache = (text, time.monotonic() + _SHOW_CACHE_TTL)
+        return text
+
+    async def build_show_message(self) -> str:
+        cached = self._show_cache
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        return self._remember(self._render(await self.repo.get_setting(SETTING_KEY)))
 
     async def set_from_text(self, text: str) -> str:
+        # команда и адрес разделены любым пробельным символом (пробел, таб, перевод строки)
         parts = (text or "").split(maxsplit=1)
-        if len(parts) < 2 or not parts[1].strip():
+        addr = parts[1].strip() if len(parts) == 2 else ""
+        if not addr:
             return "Использование: /setwallet <адрес USDT> (или /setкош <адрес>)"
 
-        addr = parts[1].strip()
-        if len(addr) < 26 or len(addr) > 128:
+        if not _MIN_ADDR_LEN <= len(addr) <= _MAX_ADDR_LEN or _SAFE_ADDR_RE.fullmatch(addr) is None:
             return "Похоже, адрес некорректный. Проверьте и попробуйте снова."
 
         await self.repo.set_setting(SETTING_KEY, addr)
+        self._remember(self._render(addr))
         return "✅ USDT-кошелёк обновлён."
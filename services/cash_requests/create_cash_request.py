@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from decimal import Decimal, InvalidOperation
+from decimal import InvalidOperation
 
-from aiogram.exceptions import TelegramAPIError
 from aiogram.types import Message
 
 from services.cash_requests.request_use_case_base import CashRequestUseCaseBase
+from utils.accounts import index_by_code
 from utils.calc import CalcError, evaluate
-from utils.formatting import format_amount_core
+from utils.formatting import ONE, format_amount_core
 from utils.request_audit import audit_lines_for_request_chat, make_audit_for_new
 from utils.request_cards import (
     CardDataDepWd,
@@ -36,25 +37,23 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 return
         else:
             try:
-                ain = evaluate(parsed.amt_in_expr)
-                aout = evaluate(parsed.amt_out_expr)
-                if ain <= 0 or aout <= 0:
+                ain_raw = evaluate(parsed.amt_in_expr)
+                aout_raw = evaluate(parsed.amt_out_expr)
+                if ain_raw <= 0 or aout_raw <= 0:
                     await message.answer("Суммы должны быть > 0")
                     return
             except (CalcError, InvalidOperation) as e:
                 await message.answer(f"Ошибка в выражении суммы: {e}")
                 return
 
-        audit = make_audit_for_new(message)
         ctx = await self._build_request_context(message, parsed.city)
-        accounts = await self.repo.snapshot_wallet(ctx.client_id)
 
         req_id = self._gen_req_id()
         pin_code = self._gen_pin()
         tg_from, tg_to = self._split_contacts(parsed.kind, parsed.contact1, parsed.contact2)
 
         if parsed.kind in ("dep", "wd"):
-            acc = next((r for r in accounts if str(r["currency_code"]).upper() == parsed.code), None)
+            acc = await self.repo.get_account(ctx.client_id, parsed.code)
             if not acc:
                 await message.answer(
                     f"Счёт {parsed.code} не найден. Добавьте валюту: /добавь {parsed.code} [точность]"
@@ -62,8 +61,7 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 return
 
             prec = int(acc.get("precision") or 2)
-            q = Decimal(10) ** -prec
-            amount = evaluate(parsed.amount_expr).quantize(q).quantize(Decimal("1"))
+            amount = amount_raw.quantize(ONE)
             pretty_amount = format_amount_core(amount, prec)
 
             data = CardDataDepWd(
@@ -78,12 +76,6 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 comment=parsed.comment,
             )
             text_client, _client_markup = build_client_card_dep_wd(data)
-            text_city, city_markup = build_city_card_dep_wd(
-                data,
-                chat_name=ctx.chat_name,
-                audit_lines=audit_lines_for_request_chat(audit),
-                changed_notice=False,
-            )
             schedule_line = self._build_schedule_line(
                 kind=parsed.kind,
                 client_name=ctx.chat_name,
@@ -91,8 +83,9 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 code=parsed.code,
             )
         else:
-            acc_in = next((r for r in accounts if str(r["currency_code"]).upper() == parsed.in_code), None)
-            acc_out = next((r for r in accounts if str(r["currency_code"]).upper() == parsed.out_code), None)
+            accounts = index_by_code(await self.repo.snapshot_wallet(ctx.client_id))
+            acc_in = accounts.get(parsed.in_code)
+            acc_out = accounts.get(parsed.out_code)
             if not acc_in:
                 await message.answer(
                     f"Счёт {parsed.in_code} не найден. Добавьте: /добавь {parsed.in_code} [точность]"
@@ -106,10 +99,8 @@ class CreateCashRequest(CashRequestUseCaseBase):
 
             prec_in = int(acc_in.get("precision") or 2)
             prec_out = int(acc_out.get("precision") or 2)
-            q_in = Decimal(10) ** -prec_in
-            q_out = Decimal(10) ** -prec_out
-            ain = evaluate(parsed.amt_in_expr).quantize(q_in).quantize(Decimal("1"))
-            aout = evaluate(parsed.amt_out_expr).quantize(q_out).quantize(Decimal("1"))
+            ain = ain_raw.quantize(ONE)
+            aout = aout_raw.quantize(ONE)
 
             pretty_in = format_amount_core(ain, prec_in)
             pretty_out = format_amount_core(aout, prec_out)
@@ -127,12 +118,6 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 comment=parsed.comment,
             )
             text_client, _client_markup = build_client_card_fx(data_fx)
-            text_city, city_markup = build_city_card_fx(
-                data_fx,
-                chat_name=ctx.chat_name,
-                audit_lines=audit_lines_for_request_chat(audit),
-                changed_notice=False,
-            )
             schedule_line = self._build_schedule_line(
                 kind="fx",
                 client_name=ctx.chat_name,
@@ -142,28 +127,46 @@ class CreateCashRequest(CashRequestUseCaseBase):
                 out_code=parsed.out_code,
             )
 
-        await message.answer(text_client, parse_mode="HTML", reply_markup=None)
+        if not ctx.request_chat_id:
+            await message.answer(text_client, parse_mode="HTML", reply_markup=None)
+            return
 
-        if ctx.request_chat_id:
-            try:
-                sent_city = await message.bot.send_message(
-                    chat_id=ctx.request_chat_id,
-                    text=text_city,
-                    parse_mode="HTML",
-                    reply_markup=city_markup,
-                )
-            except TelegramAPIError as e:
-                log.warning("Failed to send city request message: %r", e)
-                sent_city = None
-
-            if sent_city and schedule_line:
-                await self._sync_schedule_without_time(
-                    req_id=req_id,
-                    city=ctx.city,
-                    line_text=schedule_line,
-                    request_kind=parsed.kind,
-                    client_name=ctx.chat_name,
-                    request_chat_id=sent_city.chat.id,
-                    request_message_id=sent_city.message_id,
-                    bot=message.bot,
-                )
+        # Audit и карточка для чата заявок нужны только при настроенном чате города.
+        audit_lines = audit_lines_for_request_chat(make_audit_for_new(message))
+        if parsed.kind in ("dep", "wd"):
+            text_city, city_markup = build_city_card_dep_wd(
+                data,
+                chat_name=ctx.chat_name,
+                audit_lines=audit_lines,
+                changed_notice=False,
+            )
+        else:
+            text_city, city_markup = build_city_card_fx(
+                data_fx,
+                chat_name=ctx.chat_name,
+                audit_lines=audit_lines,
+                changed_notice=False,
+            )
+
+        # Карточка клиенту и карточка в чат заявок независимы — отправляем параллельно.
+        _, sent_city = await asyncio.gather(
+            message.answer(text_client, parse_mode="HTML", reply_markup=None),
+            self._send_city_card(
+                bot=message.bot,
+                chat_id=ctx.request_chat_id,
+                text_city=text_city,
+                city_markup=city_markup,
+            ),
+        )
+
+        if sent_city and schedule_line:
+            await self._sync_schedule_without_time(
+                req_id=req_id,
+                city=ctx.city,
+                line_text=schedule_line,
+                request_kind=parsed.kind,
+                client_name=ctx.chat_name,
+                request_chat_id=sent_city.chat.id,
+                request_message_id=sent_city.message_id,
+                bot=message.bot,
+            )
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import logging
-from decimal import Decimal, InvalidOperation
+from decimal import InvalidOperation
 
 from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
 from aiogram.types import Message
 
 from services.cash_requests.request_use_case_base import CashRequestUseCaseBase
+from utils.accounts import index_by_code
 from utils.calc import CalcError, evaluate
 from utils.errors import suppress_telegram_edit_errors
-from utils.formatting import format_amount_core
+from utils.formatting import ONE, format_amount_core
 from utils.request_audit import audit_lines_for_request_chat, make_audit_for_edit
 from utils.request_cards import (
     CardDataDepWd,
@@ -55,9 +56,7 @@ class EditCashRequest(CashRequestUseCaseBase):
             await message.answer("Нельзя менять тип заявки при редактировании (деп/выд/обмен).")
             return
 
-        audit = make_audit_for_edit(message, old_text=old_text)
         ctx = await self._build_request_context(message, parsed.city)
-        accounts = await self.repo.snapshot_wallet(ctx.client_id)
         tg_from, tg_to = self._split_contacts(parsed.kind, parsed.contact1, parsed.contact2)
 
         if parsed.kind in ("dep", "wd"):
@@ -73,7 +72,7 @@ class EditCashRequest(CashRequestUseCaseBase):
                 )
                 return
 
-            acc = next((r for r in accounts if str(r["currency_code"]).upper() == snap.code), None)
+            acc = await self.repo.get_account(ctx.client_id, snap.code)
             if not acc:
                 await message.answer(
                     f"Счёт {snap.code} не найден. Добавьте валюту: /добавь {snap.code} [точность]"
@@ -90,8 +89,7 @@ class EditCashRequest(CashRequestUseCaseBase):
                 return
 
             prec = int(acc.get("precision") or 2)
-            q = Decimal(10) ** -prec
-            amount_new = amount_raw_new.quantize(q).quantize(Decimal("1"))
+            amount_new = amount_raw_new.quantize(ONE)
             pretty_amount = format_amount_core(amount_new, prec)
 
             data = CardDataDepWd(
@@ -106,12 +104,6 @@ class EditCashRequest(CashRequestUseCaseBase):
                 comment=parsed.comment,
             )
             text_client, _client_markup = build_client_card_dep_wd(data)
-            text_city, city_markup = build_city_card_dep_wd(
-                data,
-                chat_name=ctx.chat_name,
-                audit_lines=audit_lines_for_request_chat(audit),
-                changed_notice=True,
-            )
             schedule_line = self._build_schedule_line(
                 kind=parsed.kind,
                 client_name=ctx.chat_name,
@@ -131,8 +123,9 @@ class EditCashRequest(CashRequestUseCaseBase):
                 )
                 return
 
-            acc_in = next((r for r in accounts if str(r["currency_code"]).upper() == snap.in_code), None)
-            acc_out = next((r for r in accounts if str(r["currency_code"]).upper() == snap.out_code), None)
+            accounts = index_by_code(await self.repo.snapshot_wallet(ctx.client_id))
+            acc_in = accounts.get(snap.in_code)
+            acc_out = accounts.get(snap.out_code)
             if not acc_in or not acc_out:
                 await message.answer("Не найдены счета для валют FX в кошельке. Добавьте валюты через /добавь ...")
                 return
@@ -149,10 +142,8 @@ class EditCashRequest(CashRequestUseCaseBase):
 
             prec_in = int(acc_in.get("precision") or 2)
             prec_out = int(acc_out.get("precision") or 2)
-            q_in = Decimal(10) ** -prec_in
-            q_out = Decimal(10) ** -prec_out
-            ain_new = ain_raw_new.quantize(q_in).quantize(Decimal("1"))
-            aout_new = aout_raw_new.quantize(q_out).quantize(Decimal("1"))
+            ain_new = ain_raw_new.quantize(ONE)
+            aout_new = aout_raw_new.quantize(ONE)
 
             pretty_in = format_amount_core(ain_new, prec_in)
             pretty_out = format_amount_core(aout_new, prec_out)
@@ -170,12 +161,6 @@ class EditCashRequest(CashRequestUseCaseBase):
                 comment=parsed.comment,
             )
             text_client, _client_markup = build_client_card_fx(data_fx)
-            text_city, city_markup = build_city_card_fx(
-                data_fx,
-                chat_name=ctx.chat_name,
-                audit_lines=audit_lines_for_request_chat(audit),
-                changed_notice=True,
-            )
             schedule_line = self._build_schedule_line(
                 kind="fx",
                 client_name=ctx.chat_name,
@@ -203,6 +188,22 @@ class EditCashRequest(CashRequestUseCaseBase):
             return
 
         if ctx.request_chat_id:
+            audit_lines = audit_lines_for_request_chat(make_audit_for_edit(message, old_text=old_text))
+            if parsed.kind in ("dep", "wd"):
+                text_city, city_markup = build_city_card_dep_wd(
+                    data,
+                    chat_name=ctx.chat_name,
+                    audit_lines=audit_lines,
+                    changed_notice=True,
+                )
+            else:
+                text_city, city_markup = build_city_card_fx(
+                    data_fx,
+                    chat_name=ctx.chat_name,
+                    audit_lines=audit_lines,
+                    changed_notice=True,
+                )
+
             sent_chat_id: int | None = None
             sent_message_id: int | None = None
             same_request_chat = bool(
@@ -236,19 +237,15 @@ class EditCashRequest(CashRequestUseCaseBase):
                             message_id=int(old_request_message_id),
                         )
 
-                try:
-                    sent_city = await message.bot.send_message(
-                        chat_id=ctx.request_chat_id,
-                        text=text_city,
-                        parse_mode="HTML",
-                        reply_markup=city_markup,
-                    )
+                sent_city = await self._send_city_card(
+                    bot=message.bot,
+                    chat_id=ctx.request_chat_id,
+                    text_city=text_city,
+                    city_markup=city_markup,
+                )
+                if sent_city:
                     sent_chat_id = int(sent_city.chat.id)
                     sent_message_id = int(sent_city.message_id)
-                except TelegramAPIError as e:
-                    log.warning("Failed to send city request message: %r", e)
-                    sent_chat_id = None
-                    sent_message_id = None
 
             if sent_chat_id and sent_message_id and schedule_line:
                 await self._sync_schedule_keep_existing_time(
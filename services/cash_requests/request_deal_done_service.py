@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Collection
 from datetime import datetime
 
 from aiogram.exceptions import TelegramAPIError
@@ -29,14 +30,14 @@ class RequestDealDoneService:
         repo: ManagerRepositoryPort,
         router_service: RequestRouterService,
         schedule_service: RequestScheduleService,
-        admin_chat_ids: set[int],
-        admin_user_ids: set[int],
+        admin_chat_ids: Collection[int],
+        admin_user_ids: Collection[int],
     ) -> None:
         self.repo = repo
         self.router_service = router_service
         self.schedule_service = schedule_service
-        self.admin_chat_ids = set(admin_chat_ids)
-        self.admin_user_ids = set(admin_user_ids)
+        self.admin_chat_ids = admin_chat_ids
+        self.admin_user_ids = admin_user_ids
 
     @staticmethod
     def _reply_html_text_and_kind(msg) -> tuple[str, bool]:
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from collections.abc import Collection
 from decimal import Decimal
 
 from aiogram.types import CallbackQuery
 
 from db_asyncpg.ports import ManagedClientWalletTransactionRepositoryPort
 from keyboards.request import CB_ISSUE_DONE
-from services.cash_requests.legacy_request_parsing import parse_kind_amount_code
 from utils.auth import require_manager_or_admin_callback
 from utils.errors import suppress_telegram_edit_errors
-from utils.formatting import format_amount_core
+from utils.formatting import ONE, format_amount_core
 from utils.info import get_chat_name
 from utils.request_text_parser import detect_kind_from_card, parse_amount_code_line
 
 log = logging.getLogger(__name__)
 
-_RE_LINE_AMOUNT = re.compile(r"^\s*Сумма:\s*(?:<code>)?(.+?)(?:</code>)?\s*$", re.I | re.M)
+# Новая карточка ("Сумма: ...") и legacy ("Депозит: ..."/"Выдача: ...") — одним проходом.
+_RE_LINE_AMOUNT = re.compile(
+    r"^\s*(?:(?P<new>Сумма)|(?P<legacy>Депозит|Выдача)):\s*(?:<code>)?(?P<payload>.+?)(?:</code>)?\s*$",
+    re.I | re.M,
+)
+_LEGACY_KIND = {"депозит": "dep", "выдача": "wd"}
 
 
 class RequestIssueService:
@@ -25,12 +31,12 @@ class RequestIssueService:
         self,
         *,
         repo: ManagedClientWalletTransactionRepositoryPort,
-        admin_chat_ids: set[int],
-        admin_user_ids: set[int],
+        admin_chat_ids: Collection[int],
+        admin_user_ids: Collection[int],
     ) -> None:
         self.repo = repo
-        self.admin_chat_ids = set(admin_chat_ids)
-        self.admin_user_ids = set(admin_user_ids)
+        self.admin_chat_ids = admin_chat_ids
+        self.admin_user_ids = admin_user_ids
 
     async def handle(self, cq: CallbackQuery) -> None:
         msg = cq.message
@@ -74,21 +80,19 @@ class RequestIssueService:
         chat_id = msg.chat.id
         chat_name = get_chat_name(msg)
         client_id = await self.repo.ensure_client(chat_id=chat_id, name=chat_name)
-        accounts = await self.repo.snapshot_wallet(client_id)
-        acc = next((r for r in accounts if str(r["currency_code"]).upper() == code), None)
+        acc = await self.repo.get_account(client_id, code)
         if not acc:
             await cq.message.answer(f"Счёт {code} не найден. Добавьте валюту: /добавь {code} [точность]")
             await cq.answer()
             return
 
         prec = int(acc.get("precision") or 2)
-        q = Decimal(10) ** -prec
-        amount = amount_raw.quantize(q).quantize(Decimal("1"))
+        amount = amount_raw.quantize(ONE)
 
         idem = f"cash:{chat_id}:{msg.message_id}"
         try:
             if op_kind == "dep":
-                await self.repo.deposit(
+                applied = await self.repo.deposit_with_balance(
                     client_id=client_id,
                     currency_code=code,
                     amount=amount,
@@ -97,7 +101,7 @@ class RequestIssueService:
                     idempotency_key=idem,
                 )
             else:
-                await self.repo.withdraw(
+                applied = await self.repo.withdraw_with_balance(
                     client_id=client_id,
                     currency_code=code,
                     amount=amount,
@@ -113,34 +117,39 @@ class RequestIssueService:
 
         log.info("Cash issue %s applied: chat_id=%s amount=%s %s", op_kind, chat_id, amount, code)
 
-        with suppress_telegram_edit_errors(context="cash issue: strip keyboard"):
-            await msg.edit_reply_markup(reply_markup=None)
-
-        accounts2 = await self.repo.snapshot_wallet(client_id)
-        acc2 = next((r for r in accounts2 if str(r["currency_code"]).upper() == code), None)
-        cur_bal = Decimal(str(acc2["balance"])) if acc2 else Decimal("0")
-        prec2 = int(acc2.get("precision") or prec) if acc2 else prec
+        bal_raw = applied.get("balance")
+        cur_bal = Decimal(str(bal_raw)) if bal_raw is not None else Decimal("0")
+        prec2 = int(applied.get("precision") or prec)
         pretty_bal = format_amount_core(cur_bal, prec2)
 
-        await cq.message.answer(
-            f"Запомнил.\nБаланс: <code>{pretty_bal} {code.lower()}</code>",
-            parse_mode="HTML",
+        # После проводки снятие кнопки, ответ с балансом и ответ на callback независимы.
+        await asyncio.gather(
+            self._strip_keyboard(msg),
+            cq.message.answer(
+                f"Запомнил.\nБаланс: <code>{pretty_bal} {code.lower()}</code>",
+                parse_mode="HTML",
+            ),
+            cq.answer("Отмечено как выдано"),
         )
-        await cq.answer("Отмечено как выдано")
 
     @staticmethod
-    def _parse_amount_code(text: str, *, op_kind: str) -> tuple[Decimal, str] | None:
-        m_amt = _RE_LINE_AMOUNT.search(text or "")
-        if m_amt:
-            return parse_amount_code_line(m_amt.group(1))
+    async def _strip_keyboard(msg) -> None:
+        with suppress_telegram_edit_errors(context="cash issue: strip keyboard"):
+            await msg.edit_reply_markup(reply_markup=None)
 
-        legacy = parse_kind_amount_code(text or "")
-        if not legacy:
+    @staticmethod
+    def _parse_amount_code(text: str, *, op_kind: str) -> tuple[Decimal, str] | None:
+        m = None
+        for hit in _RE_LINE_AMOUNT.finditer(text or ""):
+            if hit.group("new"):
+                m = hit
+                break
+            if m is None:
+                m = hit
+        if m is None:
             return None
 
-        kind_ru, amount, code = legacy
-        if op_kind == "dep" and kind_ru != "Депозит":
-            return None
-        if op_kind == "wd" and kind_ru != "Выдача":
+        legacy = m.group("legacy")
+        if legacy and _LEGACY_KIND[legacy.lower()] != op_kind:
             return None
-        return amount, code
+        return parse_amount_code_line(m.group("payload"))
@@ -25,6 +25,7 @@ class RequestRouterService:
         }
 
         self.default_city = (default_city or "екб").strip().lower()
+        self._city_keys: frozenset[str] = frozenset(self.city_cash_chats)
 
         self._request_chat_to_city: dict[int, str] = {
             int(chat_id): city
@@ -37,8 +38,8 @@ class RequestRouterService:
         }
 
     @property
-    def city_keys(self) -> set[str]:
-        return set(self.city_cash_chats.keys())
+    def city_keys(self) -> frozenset[str]:
+        return self._city_keys
 
     def normalize_city(self, city: str | None) -> str:
         city_norm = (city or "").strip().lower()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import re
+from collections.abc import Collection, Mapping
 
 from aiogram.types import Message
 
@@ -22,16 +23,22 @@ class CashRequestService:
         schedule_service: RequestScheduleService,
         cmd_map: Mapping[str, tuple[str, str]],
         fx_cmd_map: Mapping[str, tuple[str, str, str]],
-        admin_chat_ids: set[int],
-        admin_user_ids: set[int],
+        admin_chat_ids: Collection[int],
+        admin_user_ids: Collection[int],
     ) -> None:
         self.repo = repo
         self.router_service = router_service
         self.schedule_service = schedule_service
         self.cmd_map = dict(cmd_map)
         self.fx_cmd_map = dict(fx_cmd_map)
-        self.admin_chat_ids = set(admin_chat_ids)
-        self.admin_user_ids = set(admin_user_ids)
+        self._supported_commands: tuple[str, ...] = (*self.cmd_map, *self.fx_cmd_map)
+        # Один скомпилированный паттерн вместо перебора ~30 строк в aiogram Command.
+        self._command_pattern = re.compile(
+            "(?:" + "|".join(map(re.escape, self._supported_commands)) + r")\Z"
+        )
+        # наборы приходят уже замороженными из хендлера — не копируем
+        self.admin_chat_ids = admin_chat_ids
+        self.admin_user_ids = admin_user_ids
         self.create_cash_request = CreateCashRequest(
             repo=repo,
             router_service=router_service,
@@ -45,7 +52,11 @@ class CashRequestService:
 
     @property
     def supported_commands(self) -> tuple[str, ...]:
-        return tuple(set(self.cmd_map.keys()) | set(self.fx_cmd_map.keys()))
+        return self._supported_commands
+
+    @property
+    def command_pattern(self) -> re.Pattern[str]:
+        return self._command_pattern
 
     @staticmethod
     def _reply_plain(reply: Message) -> str:
@@ -71,15 +82,20 @@ class CashRequestService:
 
     @manager_or_admin_message_required
     async def handle(self, message: Message) -> None:
+        text = message.text or ""
+        if not text.startswith("/"):
+            await message.answer(self.help_text())
+            return
+
         parsed: ParsedRequest | None = parse_fx(
-            message.text or "",
+            text,
             fx_cmd_map=self.fx_cmd_map,
             city_keys=self.router_service.city_keys,
             default_city=self.router_service.default_city,
         )
         if not parsed:
             parsed = parse_dep_wd(
-                message.text or "",
+                text,
                 cmd_map=self.cmd_map,
                 city_keys=self.router_service.city_keys,
                 default_city=self.router_service.default_city,
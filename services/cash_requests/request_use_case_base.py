@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
+import secrets
 
 from aiogram.exceptions import TelegramAPIError
 from aiogram.types import Message
@@ -39,11 +40,12 @@ class CashRequestUseCaseBase:
 
     @staticmethod
     def _gen_req_id() -> str:
-        return f"Б-{random.randint(0, 999999):06d}"
+        return f"Б-{random.randrange(1_000_000):06d}"
 
     @staticmethod
     def _gen_pin() -> str:
-        return f"{random.randint(100, 999)}-{random.randint(100, 999)}"
+        # Код подтверждает выдачу наличных — берём из CSPRNG, а не из Mersenne Twister.
+        return f"{secrets.randbelow(900) + 100}-{secrets.randbelow(900) + 100}"
 
     @staticmethod
     def _build_schedule_line(
@@ -155,6 +157,25 @@ class CashRequestUseCaseBase:
             except Exception:
                 log.exception("Failed to sync schedule board for city %s", city)
 
+    @staticmethod
+    async def _send_city_card(
+        *,
+        bot,
+        chat_id: int,
+        text_city: str,
+        city_markup,
+    ) -> Message | None:
+        try:
+            return await bot.send_message(
+                chat_id=chat_id,
+                text=text_city,
+                parse_mode="HTML",
+                reply_markup=city_markup,
+            )
+        except TelegramAPIError as e:
+            log.warning("Failed to send city request message: %r", e)
+            return None
+
     async def _edit_request_chat_message(
         self,
         *,
@@ -26,7 +26,7 @@ class DailyBalancesReportService:
         self.query_service = query_service
         self.filter_service = filter_service
         self.report_builder = report_builder
-        self.admin_chat_ids = set(admin_chat_ids or [])
+        self.admin_chat_ids = frozenset(admin_chat_ids or [])
 
     async def build_report(
         self,
@@ -10,6 +10,7 @@ from db_asyncpg.ports import ExchangeWorkflowRepositoryPort
 from services.act_counter import ActCounterService
 from utils.calc import CalcError, evaluate
 from utils.exchange_base import AbstractExchangeHandler
+from utils.formatting import quantum
 
 
 @dataclass(slots=True, frozen=True)
@@ -125,8 +126,8 @@ class AcceptShortService(AbstractExchangeHandler):
         )
         accounts = await self.repo.snapshot_wallet(client_id)
 
-        acc_recv = next((row for row in accounts if str(row["currency_code"]).upper() == recv_code), None)
-        acc_pay = next((row for row in accounts if str(row["currency_code"]).upper() == pay_code), None)
+        acc_recv = next((row for row in accounts if row["currency_code"] == recv_code), None)
+        acc_pay = next((row for row in accounts if row["currency_code"] == pay_code), None)
         if not acc_recv or not acc_pay:
             missing = recv_code if not acc_recv else pay_code
             raise ValueError(f"Счёт {missing} не найден. Добавьте валюту: /добавь {missing} [точность]")
@@ -134,8 +135,8 @@ class AcceptShortService(AbstractExchangeHandler):
         recv_prec = int(acc_recv["precision"])
         pay_prec = int(acc_pay["precision"])
 
-        q_recv = Decimal(10) ** -recv_prec
-        q_pay = Decimal(10) ** -pay_prec
+        q_recv = quantum(recv_prec)
+        q_pay = quantum(pay_prec)
         recv_amount = recv_raw.quantize(q_recv, rounding=ROUND_HALF_UP)
         pay_amount = pay_raw.quantize(q_pay, rounding=ROUND_HALF_UP)
         if recv_amount == 0 or pay_amount == 0:
@@ -6,6 +6,7 @@ from decimal import ROUND_HALF_UP, Decimal
 from db_asyncpg.ports import TransactionRepositoryPort
 from services.act_counter import AppliedExchangeMovement
 from services.exchange.card_parser import parse_get_give
+from utils.formatting import quantum
 
 
 @dataclass(slots=True, frozen=True)
@@ -163,8 +164,8 @@ class ExchangeBalanceService:
             return []
 
         (old_recv_amt_raw, old_recv_code), (old_pay_amt_raw, old_pay_code) = parsed
-        q_recv = Decimal(10) ** -recv_prec
-        q_pay = Decimal(10) ** -pay_prec
+        q_recv = quantum(recv_prec)
+        q_pay = quantum(pay_prec)
         old_recv_amt = old_recv_amt_raw.quantize(q_recv, rounding=ROUND_HALF_UP)
         old_pay_amt = old_pay_amt_raw.quantize(q_pay, rounding=ROUND_HALF_UP)
         idem_prefix = f"edit:{chat_id}:{target_bot_msg_id}:{cmd_msg_id}"
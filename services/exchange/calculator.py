@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 
 from utils.calc import CalcError, evaluate
+from utils.formatting import quantum
 from utils.info import _fmt_rate
 
 
@@ -27,7 +28,7 @@ class ExchangeCalculator:
 
     @staticmethod
     def _find_account(accounts: Sequence[Mapping], code: str) -> Mapping | None:
-        return next((row for row in accounts if str(row["currency_code"]).upper() == code), None)
+        return next((row for row in accounts if row["currency_code"] == code), None)
 
     def calculate(
         self,
@@ -59,8 +60,8 @@ class ExchangeCalculator:
         recv_precision = int(acc_recv["precision"])
         pay_precision = int(acc_pay["precision"])
 
-        q_recv = Decimal(10) ** -recv_precision
-        q_pay = Decimal(10) ** -pay_precision
+        q_recv = quantum(recv_precision)
+        q_pay = quantum(pay_precision)
         recv_amount = recv_amount_raw.quantize(q_recv, rounding=ROUND_HALF_UP)
         pay_amount = pay_amount_raw.quantize(q_pay, rounding=ROUND_HALF_UP)
         if recv_amount == 0 or pay_amount == 0:
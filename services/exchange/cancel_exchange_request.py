@@ -13,7 +13,7 @@ from services.cash_requests import post_request_message
 from services.exchange.card_parser import CANCEL_REQUEST_PREFIX, parse_get_give
 from services.exchange.use_case_base import _ExchangeUseCaseBase
 from utils.errors import suppress_telegram_edit_errors
-from utils.formatting import format_amount_core
+from utils.formatting import format_amount_core, quantum
 from utils.info import get_chat_name
 from utils.req_index import req_index
 
@@ -58,7 +58,7 @@ class CancelExchangeRequest(_ExchangeUseCaseBase):
         tracked_currency_codes = {"USDT"} if single_request_chat_card else None
 
         def find_account(code: str):
-            return next((row for row in accounts if str(row["currency_code"]).upper() == code.upper()), None)
+            return next((row for row in accounts if row["currency_code"] == code.upper()), None)
 
         acc_recv = find_account(recv_code)
         acc_pay = find_account(pay_code)
@@ -68,8 +68,8 @@ class CancelExchangeRequest(_ExchangeUseCaseBase):
 
         recv_prec = int(acc_recv["precision"])
         pay_prec = int(acc_pay["precision"])
-        recv_amt = recv_amt_raw.quantize(Decimal(10) ** -recv_prec, rounding=ROUND_HALF_UP)
-        pay_amt = pay_amt_raw.quantize(Decimal(10) ** -pay_prec, rounding=ROUND_HALF_UP)
+        recv_amt = recv_amt_raw.quantize(quantum(recv_prec), rounding=ROUND_HALF_UP)
+        pay_amt = pay_amt_raw.quantize(quantum(pay_prec), rounding=ROUND_HALF_UP)
 
         try:
             recv_op_sign, pay_op_sign = await self.balance_service.apply_cancel(
@@ -203,7 +203,7 @@ class CancelExchangeRequest(_ExchangeUseCaseBase):
         def _append_balance_line(*, code: str, amount: Decimal, precision: int, sign: str | None) -> None:
             if sign is None:
                 return
-            acc = next((row for row in accounts2 if str(row["currency_code"]).upper() == code.upper()), None)
+            acc = next((row for row in accounts2 if row["currency_code"] == code.upper()), None)
             pretty_op = format_amount_core(amount, precision)
             if acc:
                 bal = Decimal(str(acc["balance"]))
@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 from decimal import Decimal, InvalidOperation
 
-_SEP = {" ", "\u00A0", "\u202F", "\u2009", "'", "’", "ʼ", "‛", "`"}
+# Разделители разрядов удаляются, запятая становится точкой — за один проход.
+_AMOUNT_TRANS = str.maketrans(",", ".", " \u00A0\u202F\u2009'’ʼ‛`")
 _RE_GET = re.compile(r"^Получаем:\s*(?:<code>)?(.+?)(?:</code>)?\s*$", re.M | re.I)
 _RE_GIVE = re.compile(r"^Отдаём:\s*(?:<code>)?(.+?)(?:</code>)?\s*$", re.M | re.I)
 _RE_REQ_ID = re.compile(r"Заявка:\s*(?:<code>)?(\d{6,})(?:</code>)?", re.IGNORECASE)
@@ -13,14 +14,11 @@ CANCEL_REQUEST_PREFIX = "⛔️ <b>Внимание! Заявка отменен
 
 
 def parse_amount_code(payload: str) -> tuple[Decimal, str] | None:
-    try:
-        amount_raw, code = payload.rsplit(" ", 1)
-    except ValueError:
+    amount_raw, sep, code = payload.rpartition(" ")
+    if not sep:
         return None
 
-    for ch in _SEP:
-        amount_raw = amount_raw.replace(ch, "")
-    amount_raw = amount_raw.replace(",", ".").strip()
+    amount_raw = amount_raw.translate(_AMOUNT_TRANS).strip()
 
     try:
         return Decimal(amount_raw), code.strip().upper()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import html
 import logging
 import random
 
@@ -11,7 +10,7 @@ from keyboards import request_keyboard
 from services.cash_requests import post_request_message
 from services.exchange.keyboards import cancel_keyboard, request_chat_keyboard
 from services.exchange.use_case_base import _ExchangeUseCaseBase
-from utils.format_wallet_compact import format_wallet_compact
+from utils.format_wallet_compact import format_wallet_compact, wallet_block_html
 from utils.info import get_chat_name
 from utils.req_index import req_index
 
@@ -58,7 +57,7 @@ class CreateExchangeRequest(_ExchangeUseCaseBase):
             rate = calc.rate
             rate_text = calc.rate_text
 
-            req_id = random.randint(10_000_000, 99_999_999)
+            req_id = 10_000_000 + random.randrange(90_000_000)
             table_req_id = await self.repo.next_request_id()
 
             creator_name = None
@@ -256,13 +255,11 @@ class CreateExchangeRequest(_ExchangeUseCaseBase):
 
             if not is_request_chat_origin:
                 accounts2 = await self.repo.snapshot_wallet(client_id)
-                compact = format_wallet_compact(accounts2, only_nonzero=True)
+                compact = format_wallet_compact(accounts2, only_nonzero=True, html_safe=True)
                 if compact == "Пусто":
                     await message.answer("Все счета нулевые. Посмотреть всё: /кошелек")
                 else:
-                    safe_title = html.escape(f"Средств у {chat_name}:")
-                    safe_rows = html.escape(compact)
-                    await message.answer(f"<code>{safe_title}\n\n{safe_rows}</code>", parse_mode="HTML")
+                    await message.answer(wallet_block_html(chat_name, compact), parse_mode="HTML")
 
         except Exception as e:
             log.exception("Exchange request creation failed")
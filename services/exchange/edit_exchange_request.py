@@ -13,7 +13,7 @@ from services.cash_requests import post_request_message
 from services.exchange.card_parser import extract_created_by, extract_request_id
 from services.exchange.keyboards import cancel_keyboard, request_chat_keyboard
 from services.exchange.use_case_base import _ExchangeUseCaseBase
-from utils.format_wallet_compact import format_wallet_compact
+from utils.format_wallet_compact import format_wallet_compact, wallet_block_html
 from utils.info import get_chat_name
 from utils.req_index import req_index
 
@@ -355,12 +355,10 @@ class EditExchangeRequest(_ExchangeUseCaseBase):
 
         if not single_request_chat_card:
             rows = await self.repo.snapshot_wallet(client_id)
-            compact = format_wallet_compact(rows, only_nonzero=True)
+            compact = format_wallet_compact(rows, only_nonzero=True, html_safe=True)
             if compact == "Пусто":
                 await message.answer("Все счета нулевые. Посмотреть всё: /кошелек")
             else:
-                safe_title = html.escape(f"Средств у {chat_name}:")
-                safe_rows = html.escape(compact)
-                await message.answer(f"<code>{safe_title}\n\n{safe_rows}</code>", parse_mode="HTML")
+                await message.answer(wallet_block_html(chat_name, compact), parse_mode="HTML")
 
         return True
@@ -46,17 +46,14 @@ class RequestTableDoneService:
         "USDT": "USDT",
     }
 
-    _SEP = {" ", "\u00A0", "\u202F", "\u2009", "'", "’", "ʼ", "‛", "`"}
+    _AMOUNT_TRANS = str.maketrans(",", ".", " \u00A0\u202F\u2009'’ʼ‛`")
 
     def __init__(self, *, sheets_gateway: SheetsTradeGateway | None = None) -> None:
         self.sheets_gateway = sheets_gateway or GutilsSheetsTradeGateway()
 
     @classmethod
     def _to_decimal(cls, raw: str) -> Decimal:
-        value = (raw or "").strip().replace(",", ".")
-        for ch in cls._SEP:
-            value = value.replace(ch, "")
-        return Decimal(value)
+        return Decimal((raw or "").translate(cls._AMOUNT_TRANS).strip())
 
     @classmethod
     def parse_callback_payload(cls, data: str) -> TableDonePayload | None:
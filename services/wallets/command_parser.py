@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable
 from decimal import Decimal
 
@@ -18,19 +19,16 @@ class WalletCommandParser:
         "usdw": "USDW", "долб": "USDW", "доллбел": "USDW", "долбел": "USDW",
         "eur500": "EUR500", "евро500": "EUR500",
     }
+    # интернированные коды: совпадают по identity с кодами из snapshot_wallet/парсеров заявок
+    _CURRENCY_ALIASES = {alias: sys.intern(code) for alias, code in _CURRENCY_ALIASES.items()}
 
     def __init__(self, *, city_cash_chat_ids: Iterable[int] | None = None) -> None:
-        self.city_cash_chat_ids = set(city_cash_chat_ids or [])
+        self.city_cash_chat_ids = frozenset(city_cash_chat_ids or ())
 
     @classmethod
     def normalize_code_alias(cls, raw_code: str) -> str:
-        key = (raw_code or "").strip().lower()
-        alias = cls._CURRENCY_ALIASES.get(key)
-        if alias:
-            return alias
-        if key in ("руб", "рубль", "рубли", "рублей", "руб."):
-            return "RUB"
-        return (raw_code or "").strip().upper()
+        code = (raw_code or "").strip()
+        return cls._CURRENCY_ALIASES.get(code.lower()) or code.upper()
 
     @staticmethod
     def extract_expr_prefix(s: str) -> str:
@@ -61,20 +59,20 @@ class WalletCommandParser:
         raw_code = parts[0]
         code = self.normalize_code_alias(raw_code)
 
-        expr_full = parts[1].strip()
-        expr = self.extract_expr_prefix(expr_full)
+        # выражение и хвост — за один split, без повторного разбора той же строки
+        expr_parts = parts[1].split(None, 1)
+        expr = expr_parts[0].replace(",", ".") if expr_parts else ""
         if not expr:
             raise ValueError("Сумма не указана. Пример: /USD 250")
 
-        first_token = expr_full.strip().split(maxsplit=1)[0]
-        tail = expr_full[len(first_token):].strip()
+        tail = expr_parts[1].strip() if len(expr_parts) > 1 else ""
 
         try:
             amount = evaluate(expr)
         except CalcError as e:
             raise ValueError(f"Ошибка в выражении суммы: {e}") from e
 
-        if amount == 0:
+        if amount.is_zero():
             raise ValueError("Сумма должна быть ненулевой")
 
         chat_id = message.chat.id
@@ -85,11 +85,10 @@ class WalletInteractionService:
             return WalletCommandResult(ok=False, message_text=f"Не удалось обработать операцию: {e}")
 
     def parse_remove_currency_callback(self, data: str | None) -> tuple[str, str]:
-        try:
-            _, code_raw, answer = (data or "").split(":")
-        except Exception as e:
-            raise ValueError("Некорректные данные") from e
-        return code_raw, answer
+        parts = (data or "").split(":")
+        if len(parts) != 3:
+            raise ValueError("Некорректные данные")
+        return parts[1], parts[2]
 
     async def build_remove_currency_callback_response(
         self,
@@ -110,14 +109,12 @@ class WalletInteractionService:
         return result.message_text, "Удалено" if result.ok else "Отклонено", not result.ok
 
     def parse_undo_callback(self, data: str | None) -> tuple[str, str, str] | None:
-        try:
-            kind, code_raw, sign, amt_str = (data or "").split(":")
-        except Exception as e:
-            raise ValueError("Некорректные данные") from e
-
-        if kind != "undo":
+        parts = (data or "").split(":")
+        if len(parts) != 4:
+            raise ValueError("Некорректные данные")
+        if parts[0] != "undo":
             return None
-        return code_raw, sign, amt_str
+        return parts[1], parts[2], parts[3]
 
     async def build_undo_response(
         self,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import time
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 
 from aiogram.types import Message
 
@@ -12,11 +14,20 @@ from services.wallets.command_parser import WalletCommandParser
 from services.wallets.models import ParsedCurrencyChange, WalletCommandResult
 from services.wallets.text_builder import WalletTextBuilder
 from utils.city_cash_transfer import city_cash_transfer_to_client
-from utils.formatting import format_amount_core
+from utils.formatting import format_amount_core, quantum
 from utils.info import get_chat_name
 
 log = logging.getLogger("wallets")
 
+# точность счёта меняется только через /добавь — держим её в памяти, чтобы не читать счёт на каждую операцию
+_PRECISION_TTL = 300.0
+_PRECISION_CACHE_MAX = 10_000
+
+
+@lru_cache(maxsize=16)
+def _min_step_text(precision: int) -> str:
+    return format_amount_core(quantum(precision), precision)
+
 
 class CurrencyMutationService:
     def __init__(
@@ -31,6 +42,49 @@ class CurrencyMutationService:
         self.parser = parser or WalletCommandParser()
         self.text_builder = text_builder or WalletTextBuilder()
         self.city_cash_media_store = city_cash_media_store
+        # (client_id, code) -> (precision, момент истечения по time.monotonic)
+        self._precision_cache: dict[tuple[int, str], tuple[int, float]] = {}
+
+    async def _get_precision(self, client_id: int, code: str) -> int | None:
+        """Точность активного счёта; None — счёта нет."""
+        key = (client_id, code)
+        hit = self._precision_cache.get(key)
+        if hit is not None and hit[1] > time.monotonic():
+            return hit[0]
+
+        acc = await self.repo.get_account(client_id, code)
+        if not acc:
+            self._precision_cache.pop(key, None)
+            return None
+        precision = int(acc["precision"]) if acc.get("precision") is not None else 2
+        if len(self._precision_cache) >= _PRECISION_CACHE_MAX:
+            # dict хранит порядок вставки — выбрасываем самую старую запись
+            self._precision_cache.pop(next(iter(self._precision_cache)))
+        self._precision_cache[key] = (precision, time.monotonic() + _PRECISION_TTL)
+        return precision
+
+    def _forget_precision(self, client_id: int, code: str) -> None:
+        self._precision_cache.pop((client_id, code), None)
+
+    @staticmethod
+    def _account_not_found(code: str) -> WalletCommandResult:
+        return WalletCommandResult(
+            ok=False,
+            message_text=(
+                f"Счёт {code} не найден.\n"
+                f"Подсказка: добавьте валюту командой /добавь {code} [точность]"
+            ),
+        )
+
+    @staticmethod
+    def _amount_too_small(code: str, precision: int) -> WalletCommandResult:
+        return WalletCommandResult(
+            ok=False,
+            message_text=(
+                f"Сумма слишком мала для точности {precision}.\n"
+                f"Минимальный шаг для {code.upper()}: {_min_step_text(precision)} {code.lower()}"
+            ),
+        )
 
     async def _apply_wallet_delta(
         self,
@@ -46,57 +100,56 @@ class CurrencyMutationService:
         with_undo: bool,
     ) -> WalletCommandResult:
         client_id = await self.repo.ensure_client(chat_id, chat_name)
-        accounts = await self.repo.snapshot_wallet(client_id)
-        acc = next((r for r in accounts if str(r["currency_code"]).upper() == code), None)
-        if not acc:
-            return WalletCommandResult(
-                ok=False,
-                message_text=(
-                    f"Счёт {code} не найден.\n"
-                    f"Подсказка: добавьте валюту командой /добавь {code} [точность]"
-                ),
-            )
+        precision = await self._get_precision(client_id, code)
+        if precision is None:
+            return self._account_not_found(code)
 
-        precision = int(acc["precision"]) if acc.get("precision") is not None else 2
-        q = Decimal(10) ** -precision
-        delta_quant = amount.copy_abs().quantize(q, rounding=ROUND_HALF_UP)
+        delta_quant = amount.copy_abs().quantize(quantum(precision), rounding=ROUND_HALF_UP)
 
-        if delta_quant == 0:
-            min_step = format_amount_core(q, precision)
-            return WalletCommandResult(
-                ok=False,
-                message_text=(
-                    f"Сумма слишком мала для точности {precision}.\n"
-                    f"Минимальный шаг для {code.upper()}: {min_step} {code.lower()}"
-                ),
-            )
+        if delta_quant.is_zero():
+            return self._amount_too_small(code, precision)
 
         comment_for_txn = expr if not extra_comment else f"{expr} | {extra_comment}"
 
-        if amount > 0:
-            await self.repo.deposit(
-                client_id=client_id,
-                currency_code=code,
-                amount=delta_quant,
-                comment=comment_for_txn,
-                source=source,
-                idempotency_key=idempotency_key,
-            )
-            sign_flag = "+"
-        else:
-            await self.repo.withdraw(
-                client_id=client_id,
-                currency_code=code,
-                amount=delta_quant,
-                comment=comment_for_txn,
-                source=source,
-                idempotency_key=idempotency_key,
-            )
-            sign_flag = "-"
+        # баланс после операции приходит из той же транзакции — без повторного snapshot_wallet
+        try:
+            if not amount.is_signed():
+                res = await self.repo.deposit_with_balance(
+                    client_id=client_id,
+                    currency_code=code,
+                    amount=delta_quant,
+                    comment=comment_for_txn,
+                    source=source,
+                    idempotency_key=idempotency_key,
+                )
+                sign_flag = "+"
+            else:
+                res = await self.repo.withdraw_with_balance(
+                    client_id=client_id,
+                    currency_code=code,
+                    amount=delta_quant,
+                    comment=comment_for_txn,
+                    source=source,
+                    idempotency_key=idempotency_key,
+                )
+                sign_flag = "-"
+        except KeyError:
+            # счёт отключили после того, как точность попала в кеш
+            self._forget_precision(client_id, code)
+            return self._account_not_found(code)
+
+        if res.get("precision") is not None and int(res["precision"]) != precision:
+            # точность поменяли в обход сервиса: репозиторий переквантовал сумму по актуальной —
+            # ответ и кнопка отката должны показывать ровно проведённую сумму
+            precision = int(res["precision"])
+            self._forget_precision(client_id, code)
+            delta_quant = delta_quant.quantize(quantum(precision), rounding=ROUND_HALF_UP)
+            if delta_quant.is_zero():
+                # проведена нулевая операция — баланс не изменился, откатывать нечего
+                return self._amount_too_small(code, precision)
 
-        accounts2 = await self.repo.snapshot_wallet(client_id)
-        acc2 = next((r for r in accounts2 if str(r["currency_code"]).upper() == code), None)
-        cur_bal = Decimal(str(acc2["balance"])) if acc2 else Decimal("0")
+        # asyncpg отдаёт NUMERIC уже как Decimal — без круга через str
+        cur_bal = res["balance"] if res.get("balance") is not None else Decimal("0")
         text = self.text_builder.currency_change_success(
             code=code,
             delta=delta_quant,
@@ -124,12 +177,11 @@ class CurrencyMutationService:
         client_id = await self.repo.ensure_client(chat_id, chat_name)
         code = self.parser.normalize_code_alias(raw_code)
 
-        accounts = await self.repo.snapshot_wallet(client_id)
-        acc = next((r for r in accounts if str(r["currency_code"]).upper() == code), None)
+        acc = await self.repo.get_account(client_id, code)
         if not acc:
             return WalletCommandResult(ok=False, message_text=f"Счёт {code} не найден.")
 
-        bal = Decimal(str(acc["balance"]))
+        bal = acc["balance"]
         prec = int(acc["precision"])
         return WalletCommandResult(
             ok=True,
@@ -160,6 +212,7 @@ class CurrencyMutationService:
 
         try:
             await self.repo.add_currency(client_id, code, precision=precision)
+            self._forget_precision(client_id, code)
             return WalletCommandResult(
                 ok=True,
                 message_text=f"✅ Валюта {code} добавлена (символов после запятой = {precision})",
@@ -259,6 +312,7 @@ class CurrencyMutationService:
 
         try:
             ok = await self.repo.remove_currency(client_id, code)
+            self._forget_precision(client_id, code)
             if ok:
                 return WalletCommandResult(ok=True, message_text=f"🗑 Валюта {code} удалена из кошелька.")
             return WalletCommandResult(
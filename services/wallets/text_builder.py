@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import html
 from decimal import Decimal
+from functools import lru_cache
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from utils.format_wallet_compact import format_wallet_compact
+from utils.format_wallet_compact import format_wallet_compact, wallet_block_html
 from utils.formatting import format_amount_core, format_amount_with_sign
 
 
 class WalletTextBuilder:
     @staticmethod
+    @lru_cache(maxsize=1024)
     def undo_kb(code: str, sign: str, amount_str: str) -> InlineKeyboardMarkup:
+        # разметку никто не мутирует — повторные суммы получают готовый объект без валидации pydantic
         data = f"undo:{code.upper()}:{sign}:{amount_str}"
         return InlineKeyboardMarkup(
             inline_keyboard=[
@@ -21,15 +23,13 @@ class WalletTextBuilder:
 
     @staticmethod
     def wallet_text(*, chat_name: str, rows: list[dict]) -> str:
-        safe_title = html.escape(f"Средств у {chat_name}:")
-        safe_rows = html.escape(format_wallet_compact(rows, only_nonzero=False))
-        return f"<code>{safe_title}\n\n{safe_rows}</code>"
+        return wallet_block_html(chat_name, format_wallet_compact(rows, only_nonzero=False, html_safe=True))
 
     @staticmethod
     def remove_currency_confirmation(*, code: str, balance: Decimal, precision: int) -> str:
         pretty_bal = format_amount_core(balance, precision)
         warn = ""
-        if balance != 0:
+        if not balance.is_zero():
             warn = (
                 f"\n⚠️ Внимание: баланс по {code} не нулевой ({pretty_bal} {code.lower()}). "
                 f"Удаление допустимо — остаток будет потерян."
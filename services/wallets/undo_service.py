@@ -33,20 +33,17 @@ class WalletUndoService:
     ) -> WalletCommandResult:
         code = self.parser.normalize_code_alias(code_raw)
         key = (chat_id, message_id)
+        client_id = await self.repo.ensure_client(chat_id, chat_name)
 
         if await undo_registry.is_done(key):
-            client_id = await self.repo.ensure_client(chat_id, chat_name)
-            rows = await self.repo.snapshot_wallet(client_id)
-            acc = next((r for r in rows if str(r["currency_code"]).upper() == code), None)
+            acc = await self.repo.get_account(client_id, code)
             if acc:
-                precision = int(acc["precision"])
-                cur_bal = Decimal(str(acc["balance"]))
                 return WalletCommandResult(
                     ok=False,
                     message_text=self.text_builder.undo_already_done_with_balance(
                         code=code,
-                        balance=cur_bal,
-                        precision=precision,
+                        balance=acc["balance"],
+                        precision=int(acc["precision"]),
                     ),
                 )
             return WalletCommandResult(ok=False, message_text=f"Операция уже отменена\nСчёт {code} не найден.")
@@ -56,46 +53,34 @@ class WalletUndoService:
         except InvalidOperation:
             return WalletCommandResult(ok=False, message_text="Ошибка суммы")
 
-        client_id = await self.repo.ensure_client(chat_id, chat_name)
-
         if sign == "+":
-            await self.repo.withdraw(
-                client_id=client_id,
-                currency_code=code,
-                amount=amount,
-                comment="undo",
-                source="undo",
-                idempotency_key=f"undo:{chat_id}:{message_id}",
-            )
-            applied_sign = "-"
+            apply_delta, applied_sign = self.repo.withdraw_with_balance, "-"
         elif sign == "-":
-            await self.repo.deposit(
-                client_id=client_id,
-                currency_code=code,
-                amount=amount,
-                comment="undo",
-                source="undo",
-                idempotency_key=f"undo:{chat_id}:{message_id}",
-            )
-            applied_sign = "+"
+            apply_delta, applied_sign = self.repo.deposit_with_balance, "+"
         else:
             return WalletCommandResult(ok=False, message_text="Некорректный знак")
 
+        # операция и баланс после неё — одна транзакция и одно соединение из пула
+        res = await apply_delta(
+            client_id=client_id,
+            currency_code=code,
+            amount=amount,
+            comment="undo",
+            source="undo",
+            idempotency_key=f"undo:{chat_id}:{message_id}",
+        )
+
         await undo_registry.mark_done(key)
 
-        rows = await self.repo.snapshot_wallet(client_id)
-        acc = next((r for r in rows if str(r["currency_code"]).upper() == code), None)
-        if acc:
-            precision = int(acc["precision"])
-            cur_bal = Decimal(str(acc["balance"]))
+        if res.get("balance") is not None:
             return WalletCommandResult(
                 ok=True,
                 message_text=self.text_builder.undo_success(
                     code=code,
                     amount=amount,
-                    precision=precision,
+                    precision=int(res["precision"]),
                     applied_sign=applied_sign,
-                    balance=cur_bal,
+                    balance=res["balance"],
                 ),
             )
 
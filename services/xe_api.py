@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from typing import Any
@@ -43,18 +46,59 @@ class ConverterAPIService:
         base_url: str,
         api_token: str,
         timeout_seconds: float = 30.0,
+        cache_ttl_seconds: float = 60.0,
+        cache_maxsize: int = 256,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
         self.timeout = httpx.Timeout(timeout_seconds, connect=10.0)
+        # Курс за минуту почти не меняется: одинаковые запросы отдаём из памяти,
+        # а одновременные промахи по одному ключу сводим в один HTTP-запрос.
+        self._cache_ttl = cache_ttl_seconds
+        self._cache_max = cache_maxsize
+        self._cache: OrderedDict[tuple[str, bool], tuple[XEConvertResult, float]] = OrderedDict()
+        self._locks: dict[tuple[str, bool], asyncio.Lock] = {}
 
     async def convert_text(self, *, text: str, include_image: bool = True) -> XEConvertResult:
-        payload = {
-            "text": text,
-            "include_image": include_image,
-        }
-        data = await self._post_json("/api/v1/convert", payload)
-        return self._parse_convert_response(data)
+        key = (" ".join(text.split()), include_image)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+
+                payload = {
+                    "text": text,
+                    "include_image": include_image,
+                }
+                data = await self._post_json("/api/v1/convert", payload)
+                result = self._parse_convert_response(data)
+                self._cache_put(key, result)
+                return result
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+    def _cache_get(self, key: tuple[str, bool]) -> XEConvertResult | None:
+        hit = self._cache.get(key)
+        if hit is None:
+            return None
+        result, expires = hit
+        if expires < time.monotonic():
+            del self._cache[key]
+            return None
+        return result
+
+    def _cache_put(self, key: tuple[str, bool], result: XEConvertResult) -> None:
+        self._cache[key] = (result, time.monotonic() + self._cache_ttl)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
 
     async def _post_json(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"{self.base_url}{path}"
@@ -4,11 +4,13 @@ from decimal import Decimal
 from html import escape
 
 from services.xe_api import XEConvertResult
+from utils.formatting import quantum
+
+_CENT = Decimal("0.01")
 
 
 def format_decimal_compact(value: Decimal, places: int) -> str:
-    q = Decimal(10) ** -places
-    value = value.quantize(q)
+    value = value.quantize(quantum(places))
     s = f"{value.normalize():f}"
     if "." in s:
         s = s.rstrip("0").rstrip(".") or "0"
@@ -16,7 +18,7 @@ def format_decimal_compact(value: Decimal, places: int) -> str:
 
 
 def format_decimal_2(value: Decimal) -> str:
-    return f"{value.quantize(Decimal('0.01')):f}"
+    return f"{value.quantize(_CENT):f}"
 
 
 def format_decimal_3(value: Decimal) -> str:
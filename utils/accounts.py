@@ -0,0 +1,10 @@
+# utils/accounts.py
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+
+def index_by_code(rows: Iterable[Mapping[str, Any]]) -> dict[str, Mapping[str, Any]]:
+    """Счета кошелька по коду валюты (UPPER) — для O(1)-поиска вместо next(...) по списку."""
+    return {str(r["currency_code"]).upper(): r for r in rows}
@@ -1,7 +1,7 @@
 # utils/auth.py
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Awaitable, Callable, Collection
 from functools import wraps
 from typing import Concatenate, ParamSpec, Protocol, TypeVar
 
@@ -15,8 +15,8 @@ R = TypeVar("R")
 
 class _ManagerAuthContext(Protocol):
     repo: ManagerRepositoryPort
-    admin_chat_ids: Iterable[int]
-    admin_user_ids: Iterable[int]
+    admin_chat_ids: Collection[int]
+    admin_user_ids: Collection[int]
 
 
 # Bound to the auth-context protocol so the decorators preserve each handler's
@@ -38,18 +38,20 @@ async def require_manager_or_admin_message(
         repo: ManagerRepositoryPort,
         message: Message,
         *,
-        admin_chat_ids: Iterable[int],
-        admin_user_ids: Iterable[int],
+        admin_chat_ids: Collection[int],
+        admin_user_ids: Collection[int],
 ) -> bool:
     """
     Разрешить, если:
       1) команда пришла из админского чата, или
       2) sender.user_id в admin_user_ids, или
       3) sender.user_id в таблице managers.
+    Проверки идут от дешёвых к дорогой: в БД идём только если оба набора не сработали.
+    Наборы ожидаются уже готовыми (frozenset в __init__ хендлера) — здесь не копируем.
     Иначе отправляет в чат отказ и возвращает False.
     """
     chat_id = message.chat.id if message.chat else None
-    if chat_id in set(admin_chat_ids):
+    if chat_id in admin_chat_ids:
         return True
 
     if not message.from_user:
@@ -57,7 +59,7 @@ async def require_manager_or_admin_message(
         return False
 
     uid = message.from_user.id
-    if uid in set(admin_user_ids):
+    if uid in admin_user_ids:
         return True
 
     if await repo.is_manager(uid):
@@ -74,14 +76,14 @@ async def require_manager_or_admin_callback(
         repo: ManagerRepositoryPort,
         cq: CallbackQuery,
         *,
-        admin_chat_ids: Iterable[int],
-        admin_user_ids: Iterable[int],
+        admin_chat_ids: Collection[int],
+        admin_user_ids: Collection[int],
 ) -> bool:
     """
     То же, что выше, но для CallbackQuery.
     """
     chat_id = cq.message.chat.id if (cq.message and cq.message.chat) else None
-    if chat_id in set(admin_chat_ids):
+    if chat_id in admin_chat_ids:
         return True
 
     if not cq.from_user:
@@ -89,7 +91,7 @@ async def require_manager_or_admin_callback(
         return False
 
     uid = cq.from_user.id
-    if uid in set(admin_user_ids):
+    if uid in admin_user_ids:
         return True
 
     if await repo.is_manager(uid):
@@ -13,6 +13,10 @@ class CalcError(Exception):
 # оба регистра). 40к → 40000, 40кк → 40 000 000, 40,5к → 40500, 20к/77 → 20000/77.
 _K_SUFFIX_RE = re.compile(r"(\d+(?:\.\d+)?|\.\d+)([kKкК]+)")
 
+# Самый частый ввод — просто число (/USD 250, /RUB -100,5): его разбираем без токенизатора.
+# Только ASCII-цифры: \d пропустил бы «٣»/«１２», которые токенизатор отвергает.
+_PLAIN_NUMBER_RE = re.compile(r"[-+]?[0-9]+(?:[.,][0-9]+)?")
+
 
 def expand_k_suffix(s: str) -> str:
     """Развернуть «к»/«k»-суффикс после числа в ×1000 за букву.
@@ -158,6 +162,22 @@ def _parse(tokens):
 
 
 def evaluate(expression: str) -> Decimal:
+    """Вычислить выражение суммы; допустимы только ASCII-цифры.
+
+    >>> evaluate("-100,5")
+    Decimal('-100.5')
+    >>> evaluate("-0,0")
+    Decimal('0.0')
+    >>> evaluate("١٢")  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    utils.calc.CalcError: Недопустимый символ в выражении
+    """
+    plain = expression.strip()
+    if _PLAIN_NUMBER_RE.fullmatch(plain):
+        d = Decimal(plain.replace(",", "."))
+        # парсер через унарный минус даёт 0, а не -0 — сохраняем то же поведение
+        return d.copy_abs() if d.is_zero() else d
     tokens = _tokenize(expression)
     result = _parse(tokens)
     if isinstance(result, _Percent):
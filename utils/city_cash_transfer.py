@@ -13,7 +13,7 @@ from aiogram.types import InputMediaPhoto, Message
 
 from db_asyncpg.ports import ClientTransferRepositoryPort
 from services.wallets.city_cash_media_store import CityCashMediaStore
-from utils.formatting import format_amount_core, format_amount_with_sign
+from utils.formatting import format_amount_core, format_amount_with_sign, quantum
 from utils.info import get_chat_name
 
 log = logging.getLogger("city_cash_transfer")
@@ -110,8 +110,7 @@ async def city_cash_transfer_to_client(
     code = (currency_code or "").strip().upper()
 
     # 2) проверить счёт клиента и точность
-    target_accounts = await repo.snapshot_wallet(target_client_id)
-    target_acc = next((r for r in target_accounts if str(r["currency_code"]).upper() == code), None)
+    target_acc = await repo.get_account(target_client_id, code)
     if not target_acc:
         return CityTransferResult(
             ok=False,
@@ -124,7 +123,7 @@ async def city_cash_transfer_to_client(
         )
 
     target_prec = int(target_acc["precision"]) if target_acc.get("precision") is not None else 2
-    q = Decimal(10) ** -target_prec
+    q = quantum(target_prec)
     delta_abs = amount_signed.copy_abs().quantize(q, rounding=ROUND_HALF_UP)
 
     if delta_abs == 0:
@@ -145,8 +144,9 @@ async def city_cash_transfer_to_client(
     comment = f"{comment} | касса: {city_tag}"
 
     try:
+        # баланс после операции возвращается из той же транзакции — повторный snapshot не нужен
         if amount_signed > 0:
-            await repo.deposit(
+            applied = await repo.deposit_with_balance(
                 client_id=target_client_id,
                 currency_code=code,
                 amount=delta_abs,
@@ -156,7 +156,7 @@ async def city_cash_transfer_to_client(
             )
             pretty_delta = format_amount_with_sign(delta_abs, target_prec, sign="+")
         else:
-            await repo.withdraw(
+            applied = await repo.withdraw_with_balance(
                 client_id=target_client_id,
                 currency_code=code,
                 amount=delta_abs,
@@ -240,11 +240,8 @@ async def city_cash_transfer_to_client(
 
     # 5) отправить баланс клиента после операции (тоже через safe-migration)
     try:
-        target_accounts2 = await repo.snapshot_wallet(target_client_id)
-        target_acc2 = next((r for r in target_accounts2 if str(r["currency_code"]).upper() == code), None)
-        target_bal = Decimal(str(target_acc2["balance"])) if target_acc2 else Decimal("0")
-        target_prec2 = int(target_acc2["precision"]) if target_acc2 and target_acc2.get("precision") is not None else (
-            target_prec)
+        target_bal = applied["balance"] if applied.get("balance") is not None else Decimal("0")
+        target_prec2 = int(applied["precision"]) if applied.get("precision") is not None else target_prec
         pretty_bal = format_amount_core(target_bal, target_prec2)
 
         async def _send_balance(chat_id: int):
@@ -1,4 +1,6 @@
+import html
 from decimal import Decimal
+from functools import lru_cache
 
 from utils.formatting import format_amount_core
 
@@ -12,10 +14,19 @@ def label_for(code: str) -> str:
     return code.lower()
 
 
-def format_wallet_compact(rows: list[dict], *, only_nonzero: bool) -> str:
+@lru_cache(maxsize=256)
+def _html_label(code: str) -> str:
+    # код валюты задаётся пользователем (/добавь), поэтому экранируем — но один раз на код;
+    # текст идёт внутрь <code>, не в атрибут — кавычки трогать не нужно
+    return html.escape(label_for(code), quote=False)
+
+
+def format_wallet_compact(rows: list[dict], *, only_nonzero: bool, html_safe: bool = False) -> str:
     """Строка для <code>…</code>:
        «  <amount right-aligned> <label>», без кода валюты слева.
+       html_safe=True — метки уже экранированы (суммы из format_amount_core безопасны).
     """
+    label_of = _html_label if html_safe else label_for
     items: list[tuple[str, str]] = []  # (amount_str, label)
     for r in rows:
         bal = Decimal(str(r["balance"]))
@@ -23,7 +34,7 @@ def format_wallet_compact(rows: list[dict], *, only_nonzero: bool) -> str:
             continue
         prec = int(r["precision"])
         amount_str = format_amount_core(bal, prec)  # уже с разделителями, 2 знака и т.д.
-        label = label_for(str(r["currency_code"]))
+        label = label_of(str(r["currency_code"]))
         items.append((amount_str, label))
 
     if not items:
@@ -32,3 +43,8 @@ def format_wallet_compact(rows: list[dict], *, only_nonzero: bool) -> str:
     width = max(len(a) for a, _ in items)
     lines = [f"  {a.rjust(width)} {lbl}" for a, lbl in items]  # 2 пробела слева
     return "\n".join(lines)
+
+
+def wallet_block_html(chat_name: str, compact_html: str) -> str:
+    """<code>-блок «Средств у …» для строки из format_wallet_compact(..., html_safe=True)."""
+    return f"<code>Средств у {html.escape(chat_name, quote=False)}:\n\n{compact_html}</code>"
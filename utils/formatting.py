@@ -3,6 +3,19 @@ from decimal import Decimal
 
 THIN_APOSTROPHE = "’"
 
+ONE = Decimal(1)
+
+_QUANTUM_CACHE: dict[int, Decimal] = {}
+
+
+def quantum(precision: int) -> Decimal:
+    """Шаг округления 10**-precision; значения кэшируются по точности."""
+    q = _QUANTUM_CACHE.get(precision)
+    if q is None:
+        q = Decimal(10) ** -precision
+        _QUANTUM_CACHE[precision] = q
+    return q
+
 
 def _group_int(int_part, sep=THIN_APOSTROPHE):
     rev = int_part[::-1]
@@ -12,8 +25,7 @@ def _group_int(int_part, sep=THIN_APOSTROPHE):
 
 def format_amount_core(amount: Decimal, precision: int, sep: str = THIN_APOSTROPHE) -> str:
     """Поддержка отрицательных значений: -1000000.5 -> '-1’000’000.50'."""
-    q = Decimal(10) ** -precision
-    a = amount.quantize(q)
+    a = amount.quantize(quantum(precision))
     neg = a < 0
     a_abs = -a if neg else a
 
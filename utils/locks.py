@@ -4,6 +4,12 @@ from collections import defaultdict
 
 
 class ChatLocks:
+    """
+    Блокировки на чат в пределах одного процесса — только упорядочивают команды чата.
+    Межпроцессную согласованность балансов даёт БД: счёт берётся FOR UPDATE
+    внутри транзакции операции, повторы режет уникальный idempotency_key.
+    """
+
     def __init__(self) -> None:
         self._locks = defaultdict(asyncio.Lock)
 
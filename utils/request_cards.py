@@ -3,6 +3,7 @@ from __future__ import annotations
 import html
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 from aiogram.types import InlineKeyboardMarkup
 
@@ -36,12 +37,20 @@ class CardDataFx:
     comment: str = ""
 
 
+_REQ_TITLES: dict[str, str] = {
+    "dep": "Заявка на внесение",
+    "wd": "Заявка на выдачу",
+}
+
+
 def _req_title(kind: str) -> str:
-    if kind == "dep":
-        return "Заявка на внесение"
-    if kind == "wd":
-        return "Заявка на выдачу"
-    return "Заявка на обмен"
+    return _REQ_TITLES.get(kind, "Заявка на обмен")
+
+
+@lru_cache(maxsize=64)
+def _code_label(code: str) -> str:
+    """Код валюты в карточке: нижний регистр, уже экранирован. Набор валют фиксирован."""
+    return html.escape(code.lower())
 
 
 def build_client_card_dep_wd(data: CardDataDepWd) -> tuple[str, InlineKeyboardMarkup | None]:
@@ -53,7 +62,7 @@ def build_client_card_dep_wd(data: CardDataDepWd) -> tuple[str, InlineKeyboardMa
         f"<b>{title}</b>: <code>{html.escape(data.req_id)}</code>",
         f"<b>Город</b>: <code>{html.escape(data.city)}</code>",
         "-----",
-        f"<b>Сумма</b>: <code>{html.escape(data.pretty_amount)} {html.escape(data.code.lower())}</code>",
+        f"<b>Сумма</b>: <code>{html.escape(data.pretty_amount)} {_code_label(data.code)}</code>",
     ]
     if data.tg_to:
         lines.append(f"<b>Принимает</b>: {data.tg_to}")
@@ -86,7 +95,7 @@ def build_city_card_dep_wd(
         f"<b>Город</b>: <code>{html.escape(data.city)}</code>",
         f"<b>Клиент</b>: <code>{html.escape(chat_name)}</code>",
         "-----",
-        f"<b>Сумма</b>: <code>{html.escape(data.pretty_amount)} {html.escape(data.code.lower())}</code>",
+        f"<b>Сумма</b>: <code>{html.escape(data.pretty_amount)} {_code_label(data.code)}</code>",
     ]
 
     if data.tg_to:
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping
+import sys
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 
 # Участник: @telegram или +телефон (6–15 цифр)
@@ -39,7 +40,7 @@ def _split_comment(tail: str) -> tuple[str, str]:
     return a.strip(), b.strip()
 
 
-def _pick_city(tokens: list[str], *, city_keys: set[str], default_city: str) -> tuple[str, list[str]]:
+def _pick_city(tokens: list[str], *, city_keys: Collection[str], default_city: str) -> tuple[str, list[str]]:
     city = (default_city or "екб").strip().lower()
     if tokens and tokens[0].strip().lower() in city_keys:
         city = tokens[0].strip().lower()
@@ -74,7 +75,7 @@ def parse_dep_wd(
     raw_text: str,
     *,
     cmd_map: Mapping[str, tuple[str, str]],   # CMD_MAP
-    city_keys: set[str],
+    city_keys: Collection[str],
     default_city: str,
 ) -> ParsedRequest | None:
     """
@@ -121,7 +122,7 @@ def parse_dep_wd(
         kind=kind,
         city=city,
         amount_expr=amount_expr,
-        code=str(code).upper(),
+        code=sys.intern(str(code).upper()),
         contact1=contact1,
         contact2=contact2,
         comment=comment,
@@ -132,7 +133,7 @@ def parse_fx(
     raw_text: str,
     *,
     fx_cmd_map: Mapping[str, tuple[str, str, str]],
-    city_keys: set[str],
+    city_keys: Collection[str],
     default_city: str,
 ) -> ParsedRequest | None:
     """
@@ -184,8 +185,8 @@ def parse_fx(
         cmd=cmd,
         kind=kind,
         city=city,
-        in_code=str(in_code).upper(),
-        out_code=str(out_code).upper(),
+        in_code=sys.intern(str(in_code).upper()),
+        out_code=sys.intern(str(out_code).upper()),
         amt_in_expr=amt_in_expr,
         amt_out_expr=amt_out_expr,
         contact1=contact1,
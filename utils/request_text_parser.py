@@ -9,10 +9,6 @@ _RE_REQ_ID_ANY = re.compile(
     r"^\s*Заявка(?:\s+на\s+(?:внесение|выдачу|обмен))?\s*:\s*(?:<code>)?([A-Za-zА-Яа-я0-9\-]+)(?:</code>)?\s*$",
     re.IGNORECASE | re.M,
 )
-_RE_LINE_PIN = re.compile(
-    r"^\s*Код:\s*(?:<tg-spoiler>)?(\d{3}-\d{3})(?:</tg-spoiler>)?\s*$",
-    re.IGNORECASE | re.M,
-)
 _RE_LINE_AMOUNT = re.compile(
     r"^\s*Сумма:\s*(?:<code>)?(.+?)(?:</code>)?\s*$",
     re.IGNORECASE | re.M,
@@ -26,11 +22,27 @@ _RE_LINE_OUT = re.compile(
     re.IGNORECASE | re.M,
 )
 
-_RE_TITLE_DEP = re.compile(r"^\s*Заявка\s+на\s+внесение\s*:", re.IGNORECASE | re.M)
-_RE_TITLE_WD = re.compile(r"^\s*Заявка\s+на\s+выдачу\s*:", re.IGNORECASE | re.M)
-_RE_TITLE_FX = re.compile(r"^\s*Заявка\s+на\s+обмен\s*:", re.IGNORECASE | re.M)
-_RE_KIND_DEP_LEGACY = re.compile(r"Код\s+получения", re.IGNORECASE)
-_RE_KIND_WD_LEGACY = re.compile(r"Код\s+выдачи", re.IGNORECASE)
+# Все поля карточки, нужные для редактирования, — за один проход по тексту.
+# В каждой альтернативе ровно одна именованная группа, имя берём из m.lastgroup.
+_RE_CARD_FIELDS = re.compile(
+    r"^\s*(?:"
+    r"Заявка(?:\s+на\s+(?:внесение|выдачу|обмен))?\s*:\s*(?:<code>)?(?P<req_id>[A-Za-zА-Яа-я0-9\-]+)(?:</code>)?"
+    r"|Код:\s*(?:<tg-spoiler>)?(?P<pin>\d{3}-\d{3})(?:</tg-spoiler>)?"
+    r"|Сумма:\s*(?:<code>)?(?P<amount>.+?)(?:</code>)?"
+    r"|Принимаем:\s*(?:<code>)?(?P<amt_in>.+?)(?:</code>)?"
+    r"|(?:Отдаем|Выдаем):\s*(?:<code>)?(?P<amt_out>.+?)(?:</code>)?"
+    r")\s*$",
+    re.IGNORECASE | re.M,
+)
+
+# Заголовок карточки или legacy-маркер кода — один проход по тексту.
+_RE_KIND = re.compile(
+    r"(?:^\s*Заявка\s+на\s+(?P<title>внесение|выдачу|обмен)\s*:)"
+    r"|(?P<dep_legacy>Код\s+получения)"
+    r"|(?P<wd_legacy>Код\s+выдачи)",
+    re.IGNORECASE | re.M,
+)
+_KIND_BY_TITLE = {"внесение": "dep", "выдачу": "wd", "обмен": "fx"}
 
 _RE_LINE_CLIENT = re.compile(r"^\s*Клиент:\s*(.+?)\s*$", re.IGNORECASE | re.M)
 
@@ -46,7 +58,14 @@ _RE_REQUEST_TITLE_ANYWHERE = re.compile(
     re.IGNORECASE | re.M,
 )
 
-_SEP = {" ", "\u00A0", "\u202F", "\u2009", "'", "’", "ʼ", "‛", "`"}
+_MK_CREATED = "\n----\nСоздал:"
+
+# Разделители разрядов удаляются, запятая становится точкой — за один проход.
+_AMOUNT_TRANS = str.maketrans(",", ".", " \u00A0\u202F\u2009'’ʼ‛`")
+# «<сумма> <код>»: сумма — цифры с разделителями, код — последний токен строки.
+_RE_AMOUNT_CODE = re.compile(
+    r"^\s*(?P<amount>-?[\d\s\u00A0\u202F\u2009'’ʼ‛`.,]+?)\s+(?P<code>[A-Za-zА-Яа-я0-9]+)\s*$"
+)
 
 
 def extract_req_id(text: str) -> str | None:
@@ -59,19 +78,29 @@ def starts_with_request(text: str) -> bool:
 
 
 def detect_kind_from_card(text: str) -> str | None:
-    if _RE_TITLE_DEP.search(text) or _RE_KIND_DEP_LEGACY.search(text):
-        return "dep"
-    if _RE_TITLE_WD.search(text) or _RE_KIND_WD_LEGACY.search(text):
-        return "wd"
-    if _RE_TITLE_FX.search(text):
-        return "fx"
-    return None
-
-
-def extract_edit_source(old_text: str) -> RequestEditSource | None:
-    m_req = _RE_REQ_ID_ANY.search(old_text)
-    m_pin = _RE_LINE_PIN.search(old_text)
-    if not (m_req and m_pin):
+    m = _RE_KIND.search(text)
+    if not m:
+        return None
+    title = m.group("title")
+    if title:
+        return _KIND_BY_TITLE[title.lower()]
+    return "dep" if m.group("dep_legacy") else "wd"
+
+
+def _scan_card_fields(text: str) -> dict[str, str]:
+    """Первое вхождение каждого поля карточки: req_id, pin, amount, amt_in, amt_out."""
+    fields: dict[str, str] = {}
+    for m in _RE_CARD_FIELDS.finditer(text):
+        name = m.lastgroup
+        if name and name not in fields:
+            fields[name] = m.group(name)
+    return fields
+
+
+def _edit_source_from_fields(fields: dict[str, str], old_text: str) -> RequestEditSource | None:
+    req_id = fields.get("req_id")
+    pin_code = fields.get("pin")
+    if not (req_id and pin_code):
         return None
 
     kind = detect_kind_from_card(old_text)
@@ -79,41 +108,41 @@ def extract_edit_source(old_text: str) -> RequestEditSource | None:
         return None
 
     return RequestEditSource(
-        req_id=m_req.group(1),
-        pin_code=m_pin.group(1),
+        req_id=req_id,
+        pin_code=pin_code,
         kind=kind,
         old_text=old_text,
     )
 
 
+def extract_edit_source(old_text: str) -> RequestEditSource | None:
+    return _edit_source_from_fields(_scan_card_fields(old_text), old_text)
+
+
 def parse_amount_code_line(blob: str) -> tuple[Decimal, str] | None:
-    try:
-        amt_str, code = blob.rsplit(" ", 1)
-    except ValueError:
+    m = _RE_AMOUNT_CODE.match(blob)
+    if not m:
         return None
 
-    for ch in _SEP:
-        amt_str = amt_str.replace(ch, "")
-    amt_str = amt_str.replace(",", ".").strip()
-
     try:
-        amt = Decimal(amt_str)
+        amt = Decimal(m.group("amount").translate(_AMOUNT_TRANS))
     except InvalidOperation:
         return None
 
-    return amt, code.strip().upper()
+    return amt, m.group("code").upper()
 
 
 def parse_dep_wd_snapshot(old_text: str, *, city: str) -> DepWdCardSnapshot | None:
-    src = extract_edit_source(old_text)
+    fields = _scan_card_fields(old_text)
+    src = _edit_source_from_fields(fields, old_text)
     if not src or src.kind not in ("dep", "wd"):
         return None
 
-    m_amt = _RE_LINE_AMOUNT.search(old_text)
-    if not m_amt:
+    amount_blob = fields.get("amount")
+    if not amount_blob:
         return None
 
-    parsed = parse_amount_code_line(m_amt.group(1))
+    parsed = parse_amount_code_line(amount_blob)
     if not parsed:
         return None
 
@@ -129,17 +158,18 @@ def parse_dep_wd_snapshot(old_text: str, *, city: str) -> DepWdCardSnapshot | No
 
 
 def parse_fx_snapshot(old_text: str, *, city: str) -> FxCardSnapshot | None:
-    src = extract_edit_source(old_text)
+    fields = _scan_card_fields(old_text)
+    src = _edit_source_from_fields(fields, old_text)
     if not src or src.kind != "fx":
         return None
 
-    m_in = _RE_LINE_IN.search(old_text)
-    m_out = _RE_LINE_OUT.search(old_text)
-    if not (m_in and m_out):
+    in_blob = fields.get("amt_in")
+    out_blob = fields.get("amt_out")
+    if not (in_blob and out_blob):
         return None
 
-    parsed_in = parse_amount_code_line(m_in.group(1))
-    parsed_out = parse_amount_code_line(m_out.group(1))
+    parsed_in = parse_amount_code_line(in_blob)
+    parsed_out = parse_amount_code_line(out_blob)
     if not parsed_in or not parsed_out:
         return None
 
@@ -166,11 +196,11 @@ def upsert_time_line(card_text: str, hhmm: str) -> str:
     text = card_text or ""
     new_line = f"Время: <code>{hhmm}</code>"
 
-    if _RE_LINE_TIME.search(text):
-        return _RE_LINE_TIME.sub(new_line, text)
+    m = _RE_LINE_TIME.search(text)
+    if m:
+        return text[:m.start()] + new_line + text[m.end():]
 
-    mk = "\n----\nСоздал:"
-    idx = text.find(mk)
+    idx = text.find(_MK_CREATED)
     if idx != -1:
         return text[:idx] + "\n" + new_line + text[idx:]
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 import calendar
 import io
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -19,6 +20,11 @@ from utils.info import get_chat_name
 
 log = logging.getLogger(__name__)
 
+CB_STMT_MONTH = "stmt:month"
+CB_STMT_ALL = "stmt:all"
+# для F.data.in_(...) в хендлерах: один неизменяемый набор на все регистрации
+STMT_CALLBACKS: frozenset[str] = frozenset({CB_STMT_MONTH, CB_STMT_ALL})
+
 
 def statements_kb() -> InlineKeyboardMarkup:
     """
@@ -28,8 +34,8 @@ def statements_kb() -> InlineKeyboardMarkup:
     """
     return InlineKeyboardMarkup(
         inline_keyboard=[
-            [InlineKeyboardButton(text="📄 Выписка за месяц", callback_data="stmt:month")],
-            [InlineKeyboardButton(text="📄 Выписка за всё время", callback_data="stmt:all")],
+            [InlineKeyboardButton(text="📄 Выписка за месяц", callback_data=CB_STMT_MONTH)],
+            [InlineKeyboardButton(text="📄 Выписка за всё время", callback_data=CB_STMT_ALL)],
         ]
     )
 
@@ -112,6 +118,26 @@ def _build_statement_xlsx(rows: list[dict], chat_name: str, period_label: str) -
     return output.read()
 
 
+_Period = tuple[datetime | None, datetime | None, str, str]  # (since, until, label, suffix файла)
+
+
+def _period_month(now: datetime) -> _Period:
+    dt_from, dt_to = _month_bounds(now)
+    label = f"{dt_from:%Y-%m-01} — {(dt_to - timedelta(seconds=1)):%Y-%m-%d %H:%M} UTC"
+    return dt_from, dt_to, label, f"{dt_from:%Y%m}"
+
+
+def _period_all(now: datetime) -> _Period:
+    return None, None, "всё время", "all"
+
+
+# stmt:<kind> -> построитель периода
+_PERIODS: dict[str, Callable[[datetime], _Period]] = {
+    "month": _period_month,
+    "all": _period_all,
+}
+
+
 async def handle_stmt_callback(cq: CallbackQuery, repo: ClientTransactionRepositoryPort) -> None:
     """
     Универсальный обработчик callback'ов выписок:
@@ -124,27 +150,18 @@ async def handle_stmt_callback(cq: CallbackQuery, repo: ClientTransactionReposit
         await cq.answer()
         return
 
-    data = (cq.data or "")
-    try:
-        kind = data.split(":", 1)[1]
-    except IndexError:
+    _, sep, kind = (cq.data or "").partition(":")
+    if not sep:
         await cq.answer("Некорректные данные", show_alert=True)
         return
 
+    period_of = _PERIODS.get(kind)
+    if period_of is None:
+        await cq.answer("Неизвестный период", show_alert=True)
+        return
+
     try:
-        now = datetime.now(UTC)
-        if kind == "month":
-            dt_from, dt_to = _month_bounds(now)
-            period_label = f"{dt_from:%Y-%m-01} — {(dt_to - timedelta(seconds=1)):%Y-%m-%d %H:%M} UTC"
-            suffix = f"{dt_from:%Y%m}"
-            since_arg, until_arg = dt_from, dt_to
-        elif kind == "all":
-            period_label = "всё время"
-            suffix = "all"
-            since_arg, until_arg = None, None
-        else:
-            await cq.answer("Неизвестный период", show_alert=True)
-            return
+        since_arg, until_arg, period_label, suffix = period_of(datetime.now(UTC))
 
         chat_id = msg.chat.id
         chat_name = get_chat_name(msg)